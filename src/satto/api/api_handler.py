@@ -7,14 +7,17 @@ from .providers.api_handler_base import ApiHandlerBase
 from .providers.together_openai import TogetherOpennAIHandler
 
 
+# Provider name -> handler class
+API_HANDLERS = {
+    "anthropic": AnthropicHandler,
+    "openai": OpenAiHandler,
+    "openai-native": OpenAiNativeHandler,
+    "together": TogetherOpennAIHandler,
+}
+
+
 def build_api_handler(api_provider: ApiConfiguration) -> ApiHandlerBase:
-    handlers = {
-        "anthropic": AnthropicHandler,
-        "openai": OpenAiHandler,
-        "openai-native": OpenAiNativeHandler,
-        "together": TogetherOpennAIHandler,
-    }
-    if api_provider.name not in handlers:
+    handler_class = API_HANDLERS.get(api_provider.name)
+    if handler_class is None:
         raise ValueError(f"Unsupported API provider: {api_provider.name}")
-    handler_class = handlers.get(api_provider.name)    
     return handler_class(options=api_provider)
@@ -1,4 +1,5 @@
 from .api_handler_base import ApiHandlerBase
+from .http_client import get_shared_http_client, close_shared_http_client
 from .anthropic import AnthropicHandler
 from .openai_native import OpenAiNativeHandler
 from .together import TogetherHandler
@@ -1,9 +1,9 @@
-import asyncio
 import time
 import sys
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 from typing import AsyncGenerator, Dict, Any, List, Optional
 from .api_handler_base import ApiHandlerBase
+from .http_client import get_shared_http_client
 from ...shared.dicts import DotDict
 from ...shared.api import anthropic_models, anthropic_default_model_id
 
@@ -11,26 +11,19 @@ from ...shared.api import anthropic_models, anthropic_default_model_id
 class AnthropicHandler(ApiHandlerBase):
     def __init__(self, options: Dict[str, Any]):
         self.options = options
-        self.client = Anthropic(
+        self.client = AsyncAnthropic(
             api_key=self.options["api_key"],
-            base_url=self.options.get("anthropic_base_url")
+            base_url=self.options.get("anthropic_base_url"),
+            http_client=get_shared_http_client(),
         )
-        self.usage = {
-                    "input_tokens": 0,                    
-                    "output_tokens": 0,
-                    "cache_write_tokens": 0,
-                    "cache_read_tokens": 0,
-                }
+        self.max_tokens = self.model["info"].get("max_tokens", 8192)
         super().__init__()
         
     async def create_message(self, system_prompt: str, messages: list) -> Dict[str, Any]:
-        model = self.get_model()
-        model_id = model["id"]
-
         # Create message parameters
         message_params = {
-            "model": model_id,
-            "max_tokens": model["info"].get("max_tokens", 8192),
+            "model": self.model_id,
+            "max_tokens": self.max_tokens,
             "temperature": 0,
             "system": [
                 {
@@ -43,56 +36,53 @@ class AnthropicHandler(ApiHandlerBase):
             "stream": True
         }
      
-        stream = await asyncio.to_thread(
-            self.client.messages.create,
+        stream = await self.client.messages.create(
             **message_params,
             extra_headers={
                 "anthropic-beta": "prompt-caching-2024-07-31",
             }
         )
 
-        full_text = ""
-      
+        text_parts = []
+        # Usage is tracked per call, so each response reports only its own tokens
+        input_tokens = output_tokens = cache_write_tokens = cache_read_tokens = 0
+
         self.init_progerss()
 
-        for chunk in stream:            
+        async for chunk in stream:
             if not hasattr(chunk, 'type'):
                 continue
                 
             self.print_progress()
             if chunk.type == 'message_start':       
                 usage = chunk.message.usage         
-                self.usage["input_tokens"] += getattr(usage, 'input_tokens', 0)
-                self.usage["output_tokens"] += getattr(usage, 'output_tokens', 0)
-                self.usage["cache_write_tokens"] += getattr(usage, 'cache_creation_input_tokens', 0)
-                self.usage["cache_read_tokens"] += getattr(usage, 'cache_read_input_tokens', 0)            
-            elif chunk.type == 'message_delta':                
-                self.usage["output_tokens"] += chunk.usage.output_tokens                            
+                input_tokens += getattr(usage, 'input_tokens', 0) or 0
+                output_tokens += getattr(usage, 'output_tokens', 0) or 0
+                cache_write_tokens += getattr(usage, 'cache_creation_input_tokens', 0) or 0
+                cache_read_tokens += getattr(usage, 'cache_read_input_tokens', 0) or 0
+            elif chunk.type == 'message_delta':
+                # The delta's output token count is cumulative for the whole message
+                output_tokens = chunk.usage.output_tokens
             elif chunk.type == 'message_stop':
                 break
             elif chunk.type == 'content_block_start':                
                 if chunk.index > 0:
-                    full_text += "\n"
-                full_text += chunk.content_block.text
+                    text_parts.append("\n")
+                text_parts.append(getattr(chunk.content_block, 'text', ''))
             elif chunk.type == 'content_block_delta':
-                full_text += chunk.delta.text                
-            elif chunk.type == 'content_block_stop':
-                break
+                text_parts.append(getattr(chunk.delta, 'text', ''))
         self.after_progerss()
+        full_text = "".join(text_parts)
 
-        self.usage["output_tokens"] += len(full_text.split())        
-
-        if not self.usage:
-            # Fallback if we didn't get usage info from the stream
-            self.usage = {
-                "input_tokens": 0,
-                "output_tokens": 0
-            }
-        
         response = DotDict({
             "type": "text",
             "text": full_text,
-            "usage": DotDict(self.usage) if self.usage else None
+            "usage": {
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "cache_write_tokens": cache_write_tokens,
+                "cache_read_tokens": cache_read_tokens,
+            }
         })    
         return response
 
@@ -1,12 +1,29 @@
 import sys
 import time
-import json
+import asyncio
 import inspect
-from typing import Protocol, Dict, Any, Union
+import json
+from contextlib import asynccontextmanager
+from functools import cached_property, lru_cache
+from typing import Protocol, Any, Union, AsyncIterator
 
 from ...shared.dicts import DotDict
 from ...shared.api import ModelInfo
 
+# Minimum seconds between progress line updates, so fast streams don't flush stdout on every chunk
+PROGRESS_INTERVAL = 0.05
+
+# Number of chunks the background stream reader may buffer ahead of the consumer
+STREAM_QUEUE_SIZE = 64
+
+_STREAM_END = object()
+
+
+@lru_cache(maxsize=None)
+def _get_param_names(func) -> frozenset:
+    """Return the parameter names accepted by func, computing its signature only once."""
+    return frozenset(inspect.signature(func).parameters)
+
 
 class ApiHandlerBase(Protocol):
     def __init__(self):
@@ -20,29 +37,108 @@ class ApiHandlerBase(Protocol):
     def get_model(self) -> DotDict[str, Union[str, ModelInfo]]:
         pass
 
+    @cached_property
+    def model(self) -> DotDict[str, Union[str, ModelInfo]]:
+        """The handler's model. It is fixed for the handler's lifetime, so it is resolved once."""
+        return self.get_model()
+
+    @cached_property
+    def model_id(self) -> str:
+        """The model ID sent with each request."""
+        return self.model["id"]
+
     def get_filtered_args(self, func, **kwargs):
         """Calls func with only the arguments it accepts."""
-        # Get the function's signature
-        sig = inspect.signature(func)
-        
+        # Get the function's parameter names, keyed on the underlying function since
+        # bound methods are recreated on every attribute access
+        param_names = _get_param_names(getattr(func, "__func__", func))
+
         # Filter out arguments that the function does not accept
-        filtered_args = {k: v for k, v in kwargs.items() if k in sig.parameters}
+        filtered_args = {k: v for k, v in kwargs.items() if k in param_names}
         
         # Call the function with the filtered arguments
         return DotDict(filtered_args)
     
+    @asynccontextmanager
+    async def buffered_stream(self, stream: AsyncIterator[Any]) -> AsyncIterator[AsyncIterator[Any]]:
+        """Iterate stream while a background task keeps receiving the next chunks.
+
+        Used as ``async with self.buffered_stream(stream) as chunks: async for chunk in chunks``.
+        Network receive and per-chunk processing overlap through a bounded queue, and
+        errors raised by the stream are re-raised to the consumer. On leaving the block,
+        also early or through an error, the reader is cancelled and awaited and the stream
+        is closed, so the underlying HTTP response goes back to the connection pool.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+
+        async def drain():
+            try:
+                async for chunk in stream:
+                    await queue.put(chunk)
+            except Exception as ex:
+                await queue.put(ex)
+                return
+            await queue.put(_STREAM_END)
+
+        async def chunks():
+            while True:
+                item = await queue.get()
+                if item is _STREAM_END:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+
+        reader = asyncio.create_task(drain())
+        try:
+            yield chunks()
+        finally:
+            reader.cancel()
+            # wait() does not re-raise the reader's cancellation, but still lets a
+            # cancellation of this task through
+            await asyncio.wait([reader])
+            close = getattr(stream, "aclose", None) or getattr(stream, "close", None)
+            if close is not None:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+
+    async def iter_sse_json(self, lines: AsyncIterator[str]) -> AsyncIterator[dict]:
+        """Yield the decoded JSON payload of each `data:` frame in a raw server-sent event stream.
+
+        Parsing the frames directly skips building an SDK model object for every chunk.
+        """
+        json_loads = json.loads
+        async for line in lines:
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                break
+            payload = json_loads(data)
+            if "error" in payload:
+                raise RuntimeError(f"API stream error: {payload['error']}")
+            yield payload
+
     def init_progerss(self):
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.chunk_count = 0
+        self.last_progress_time = 0.0
 
     def after_progerss(self):
-        # Print newline after progress
-        print()   
+        # The last update may have been throttled, so print the final count before the newline
+        self._write_progress(time.monotonic())
+        print()
 
     def print_progress(self):
-        self.chunk_count += 1        
-        elapsed = time.time() - self.start_time
-        sys.stdout.write(f"\rReceived {self.chunk_count} chunks in {elapsed:.2f}s")
+        self.chunk_count += 1
+        now = time.monotonic()
+        if now - self.last_progress_time >= PROGRESS_INTERVAL:
+            self._write_progress(now)
+
+    def _write_progress(self, now: float):
+        self.last_progress_time = now
+        sys.stdout.write(f"\rReceived {self.chunk_count} chunks in {now - self.start_time:.2f}s")
         sys.stdout.flush()
 
 
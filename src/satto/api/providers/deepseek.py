@@ -1,6 +1,7 @@
 from typing import Any, Dict
 from openai import AsyncOpenAI
 from .api_handler_base import ApiHandlerBase
+from .http_client import get_shared_http_client
 from ...shared.api import ApiConfiguration, ModelInfo, deepseek_models, deepseek_default_model_id
 from ..transform.openai_format import convert_to_openai_messages
 from ..transform.r1_format import convert_to_r1_format
@@ -12,11 +13,11 @@ class DeepSeekHandler(ApiHandlerBase):
         self.client = AsyncOpenAI(
             base_url="https://api.deepseek.com/v1",
             api_key=self.options.api_key,
+            http_client=get_shared_http_client(),
         )
 
     async def create_message(self, system_prompt: str, messages: list) -> Dict[str, Any]:
-        model = self.get_model()
-        is_deepseek_reasoner = "deepseek-reasoner" in model["id"]
+        is_deepseek_reasoner = "deepseek-reasoner" in self.model_id
 
         if is_deepseek_reasoner:
             openai_messages = convert_to_r1_format([
@@ -29,36 +30,45 @@ class DeepSeekHandler(ApiHandlerBase):
                 *convert_to_openai_messages(messages),
             ]
 
-        stream = await self.client.chat.completions.create(
-            model=model["id"],
-            max_completion_tokens=model["info"].max_tokens,
+        text_parts = []
+        reasoning_parts = []
+        usage = None
+
+        append_text = text_parts.append
+        append_reasoning = reasoning_parts.append
+        # Read the raw SSE frames rather than the SDK's parsed chunk objects
+        async with self.client.chat.completions.with_streaming_response.create(
+            model=self.model_id,
+            max_completion_tokens=self.model["info"]["max_tokens"],
             messages=openai_messages,
-            temperature=0 if model["id"] != "deepseek-reasoner" else None,
+            temperature=0 if self.model_id != "deepseek-reasoner" else None,
             stream=True,
             stream_options={"include_usage": True},
-        )
-
-        full_text = ""
-        full_reasoning = ""
-        usage = None
-
-        async for chunk in stream:
-            delta = chunk.choices[0].delta if chunk.choices else None
-            if delta:
-                if delta.content:
-                    full_text += delta.content
-                if hasattr(delta, "reasoning_content") and delta.reasoning_content:
-                    full_reasoning += delta.reasoning_content
-            if hasattr(chunk, "usage") and chunk.usage:
-                usage = chunk.usage
+        ) as response:
+            async with self.buffered_stream(self.iter_sse_json(response.iter_lines())) as chunks:
+                async for chunk in chunks:
+                    choices = chunk.get("choices")
+                    if choices:
+                        delta = choices[0].get("delta") or {}
+                        content = delta.get("content")
+                        if content:
+                            append_text(content)
+                        reasoning_content = delta.get("reasoning_content")
+                        if reasoning_content:
+                            append_reasoning(reasoning_content)
+                    chunk_usage = chunk.get("usage")
+                    if chunk_usage:
+                        usage = chunk_usage
+        full_text = "".join(text_parts)
+        full_reasoning = "".join(reasoning_parts)
 
         result = {
             "text": full_text,
             "usage": {
-                "input_tokens": usage.prompt_tokens if usage else 0,
-                "output_tokens": usage.completion_tokens if usage else 0,
-                "cache_read_tokens": getattr(usage, "prompt_cache_hit_tokens", 0) if usage else 0,
-                "cache_write_tokens": getattr(usage, "prompt_cache_miss_tokens", 0) if usage else 0,
+                "input_tokens": usage.get("prompt_tokens", 0),
+                "output_tokens": usage.get("completion_tokens", 0),
+                "cache_read_tokens": usage.get("prompt_cache_hit_tokens", 0),
+                "cache_write_tokens": usage.get("prompt_cache_miss_tokens", 0),
             } if usage else None
         }
 
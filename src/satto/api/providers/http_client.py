@@ -0,0 +1,36 @@
+"""Shared HTTP client used by the Anthropic and OpenAI-compatible API handlers."""
+from typing import Optional
+
+import httpx
+
+# Connection pool limits for the shared client
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+
+_shared_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """Return the process-wide async HTTP client, creating it on first use.
+
+    Sharing one client lets every handler reuse the same keep-alive connections
+    instead of paying a new TCP and TLS handshake per handler.
+    """
+    global _shared_http_client
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            timeout=httpx.Timeout(600.0, connect=5.0),
+        )
+    return _shared_http_client
+
+
+async def close_shared_http_client() -> None:
+    """Close the shared HTTP client, if it was created."""
+    global _shared_http_client
+    if _shared_http_client is not None:
+        await _shared_http_client.aclose()
+        _shared_http_client = None
@@ -1,6 +1,8 @@
+from functools import cached_property
 from typing import Any, AsyncGenerator, Dict, Optional
 from openai import AsyncOpenAI, AsyncAzureOpenAI
 from .api_handler_base import ApiHandlerBase
+from .http_client import get_shared_http_client
 from ...shared.api import ApiConfiguration, ModelInfo, openai_model_info_sane_defaults, azure_openai_default_api_version
 from ..transform.openai_format import convert_to_openai_messages
 
@@ -8,48 +10,61 @@ from ..transform.openai_format import convert_to_openai_messages
 class OpenAiHandler(ApiHandlerBase):
     def __init__(self, options: ApiConfiguration):
         self.options = options
+        base_url = self.options.get("openai_base_url") or ""
         # Azure API shape slightly differs from the core API shape
-        if self.options.get("openai_base_url", "").lower().find("azure.com") != -1:
+        if "azure.com" in base_url.lower():
             self.client = AsyncAzureOpenAI(
                 base_url=self.options.get("openai_base_url"),
                 api_key=self.options.api_key,
                 api_version=self.options.get("azure_api_version") or azure_openai_default_api_version,
+                http_client=get_shared_http_client(),
             )
         else:
             self.client = AsyncOpenAI(
                 base_url=self.options.get("openai_base_url"),
                 api_key=self.options.api_key,
+                http_client=get_shared_http_client(),
             )
 
+    @cached_property
+    def model_id(self) -> str:
+        """The model sent with each request, read from the model_id option as before."""
+        return self.options.get("model_id", "")
+
     async def create_message(self, system_prompt: str, messages: list) -> Dict[str, Any]:
         openai_messages = [
             {"role": "system", "content": system_prompt},
             *convert_to_openai_messages(messages),
         ]
         
-        stream = await self.client.chat.completions.create(
-            model=self.options.get("model_id", ""),
+        text_parts = []
+        usage = None
+
+        append_text = text_parts.append
+        # Read the raw SSE frames rather than the SDK's parsed chunk objects
+        async with self.client.chat.completions.with_streaming_response.create(
+            model=self.model_id,
             messages=openai_messages,
             temperature=0,
             stream=True,
             stream_options={"include_usage": True},
-        )
-
-        full_text = ""
-        usage = None
-
-        async for chunk in stream:
-            delta = chunk.choices[0].delta if chunk.choices else None
-            if delta and delta.content:
-                full_text += delta.content
-            if hasattr(chunk, "usage") and chunk.usage:
-                usage = chunk.usage
+        ) as response:
+            async with self.buffered_stream(self.iter_sse_json(response.iter_lines())) as chunks:
+                async for chunk in chunks:
+                    choices = chunk.get("choices")
+                    if choices:
+                        content = (choices[0].get("delta") or {}).get("content")
+                        if content:
+                            append_text(content)
+                    chunk_usage = chunk.get("usage")
+                    if chunk_usage:
+                        usage = chunk_usage
 
         return {
-            "text": full_text,
+            "text": "".join(text_parts),
             "usage": {
-                "input_tokens": usage.prompt_tokens if usage else 0,
-                "output_tokens": usage.completion_tokens if usage else 0,
+                "input_tokens": usage.get("prompt_tokens", 0),
+                "output_tokens": usage.get("completion_tokens", 0),
             } if usage else None
         }
 
@@ -1,35 +1,58 @@
 import re
 import ast
-from typing import Any, Dict, Optional
+import json
+from functools import cached_property
+from typing import Any, Dict
 from openai import AsyncOpenAI
 from .api_handler_base import ApiHandlerBase
+from .http_client import get_shared_http_client
 from ..transform.openai_format import convert_to_openai_messages
 from ...shared.api import openai_native_models, openai_native_default_model_id
 from ...shared.dicts import DotDict
 
+_ERROR_PAYLOAD_RE = re.compile(r"\{.*\}", re.DOTALL)
+
 
 class OpenAiNativeHandler(ApiHandlerBase):
     def __init__(self, options: Dict[str, Any]):
         self.options = options
         self.client = AsyncOpenAI(
             api_key=self.options.api_key,
+            http_client=get_shared_http_client(),
         )
         super().__init__()
 
+    @cached_property
+    def model_id(self) -> str:
+        """The configured model name, which may not be in openai_native_models, since that is what gets sent."""
+        return self.options.get("model")
+
     def extract_error(self, exception_message: Exception) -> Dict[str, Any]:
-        match = re.search(r"\{.*\}", str(exception_message))
+        match = _ERROR_PAYLOAD_RE.search(str(exception_message))
         if match:
             error_json_str = match.group(0)
-            
+
+            try:
+                # Fast path: the payload is usually valid JSON
+                return DotDict(json.loads(error_json_str))
+            except ValueError:
+                pass
+
+            try:
+                # SDK error messages often embed a Python repr, which is JSON apart from its quotes
+                return DotDict(json.loads(error_json_str.replace("'", '"')))
+            except ValueError:
+                pass
+
             try:
-                # Use ast.literal_eval to safely convert the string to a Python dictionary
+                # Fall back to ast.literal_eval for Python-repr payloads (single quotes, None, True)
                 error_dict = ast.literal_eval(error_json_str)
                 return DotDict(error_dict)
             except (ValueError, SyntaxError) as e:
-                print("Failed to parse JSON:", e)    
+                print("Failed to parse JSON:", e)
 
     async def create_message(self, system_prompt: str, messages: list) -> Dict[str, Any]:
-        model_id = self.options.model
+        model_id = self.model_id
 
         role = "developer" if model_id == "o3-mini" else "system"
 
@@ -57,10 +80,10 @@ class OpenAiNativeHandler(ApiHandlerBase):
             
             return DotDict({
                 "text": response.choices[0].message.content if response.choices else "",
-                "usage": DotDict({
+                "usage": {
                     "input_tokens": response.usage.prompt_tokens if response.usage else 0,
                     "output_tokens": response.usage.completion_tokens if response.usage else 0,
-                }) if response.usage else None
+                } if response.usage else None
             })
 
         # For other models, use streaming
@@ -72,24 +95,30 @@ class OpenAiNativeHandler(ApiHandlerBase):
             return error
         
         self.init_progerss()
-        full_text = ""
+        text_parts = []
         usage = None
 
-        async for chunk in stream:
-            self.print_progress()
-            delta = chunk.choices[0].delta if chunk.choices else None
-            if delta and delta.content:
-                full_text += delta.content
-            if hasattr(chunk, "usage") and chunk.usage:
-                usage = chunk.usage
+        append_text = text_parts.append
+        print_progress = self.print_progress
+        async with self.buffered_stream(stream) as chunks:
+            async for chunk in chunks:
+                print_progress()
+                choices = chunk.choices
+                if choices:
+                    content = choices[0].delta.content
+                    if content:
+                        append_text(content)
+                chunk_usage = getattr(chunk, "usage", None)
+                if chunk_usage:
+                    usage = chunk_usage
         self.after_progerss()
 
         return DotDict({
-            "text": full_text,
-            "usage": DotDict({
+            "text": "".join(text_parts),
+            "usage": {
                 "input_tokens": usage.prompt_tokens if usage else 0,
                 "output_tokens": usage.completion_tokens if usage else 0,
-            }) if usage else None
+            } if usage else None
         })
 
     def get_model(self) -> Dict[str, Any]:
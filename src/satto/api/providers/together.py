@@ -1,6 +1,6 @@
 from typing import Any, Dict
 
-from together import Together
+from together import AsyncTogether
 
 
 from .api_handler_base import ApiHandlerBase
@@ -12,7 +12,7 @@ from ...shared.dicts import DotDict
 class TogetherHandler(ApiHandlerBase):
     def __init__(self, options: ApiConfiguration):
         self.options = options
-        self.client = Together(api_key=self.options["api_key"])
+        self.client = AsyncTogether(api_key=self.options["api_key"])
 
     async def create_message(self, system_prompt: str, messages: list) -> Dict[str, Any]:
 
@@ -25,31 +25,37 @@ class TogetherHandler(ApiHandlerBase):
         message_payload["messages"] = openai_messages
 
         try:            
-            response = self.client.chat.completions.create(**message_payload)
+            response = await self.client.chat.completions.create(**message_payload)
         except Exception as ex:
             print(f"Error: {ex}")
             raise
 
         self.init_progerss()
-        full_text = ""
+        text_parts = []
         full_reasoning = ""
         usage = None
                 
-        for chunk in response:            
-            self.print_progress()
-            delta = chunk.choices[0].delta.content
-            full_text += delta
-            if hasattr(chunk, "usage") and chunk.usage:
+        append_text = text_parts.append
+        print_progress = self.print_progress
+        async for chunk in response:
+            print_progress()
+            choices = chunk.choices
+            if choices:
+                content = choices[0].delta.content
+                if content:
+                    append_text(content)
+            chunk_usage = getattr(chunk, "usage", None)
+            if chunk_usage:
                 usage = {
-                    "input_tokens": chunk.usage.prompt_tokens,
-                    "output_tokens": chunk.usage.completion_tokens,
+                    "input_tokens": chunk_usage.prompt_tokens,
+                    "output_tokens": chunk_usage.completion_tokens,
                     "cache_read_tokens": 0,
                     "cache_write_tokens": 0,
                 }
         self.after_progerss()
 
         result = DotDict({
-            "text": full_text,
+            "text": "".join(text_parts),
             "usage": usage
         })
 
@@ -6,11 +6,14 @@ from openai import AsyncOpenAI
 
 
 from .api_handler_base import ApiHandlerBase
+from .http_client import get_shared_http_client
 from ..transform.r1_format import convert_to_r1_format
 from ...shared.api import ApiConfiguration, ModelInfo, openai_model_info_sane_defaults
 from ..transform.openai_format import convert_to_openai_messages
 from ...shared.dicts import DotDict
 
+_THINK_TAGS_RE = re.compile(r'<think>.*?</think>\s*', re.DOTALL)
+
 
 class TogetherOpennAIHandler(ApiHandlerBase):
     def __init__(self, options: ApiConfiguration):
@@ -18,6 +21,7 @@ class TogetherOpennAIHandler(ApiHandlerBase):
         self.client = AsyncOpenAI(
             api_key=self.options.api_key,
             base_url=self.options.base_url,
+            http_client=get_shared_http_client(),
         )
         super().__init__()
 
@@ -25,8 +29,7 @@ class TogetherOpennAIHandler(ApiHandlerBase):
 
         message_payload = self.get_filtered_args(self.client.chat.completions.create, **self.options)  
 
-        model_id = self.options.get("model", "")
-        is_deepseek_reasoner = "deepseek-reasoner" in model_id.lower()
+        is_deepseek_reasoner = "deepseek-reasoner" in self.model_id.lower()
         
         if is_deepseek_reasoner:
             message_payload["messages"] = convert_to_r1_format([{"role": "user", "content": system_prompt}, *messages])
@@ -40,28 +43,38 @@ class TogetherOpennAIHandler(ApiHandlerBase):
             raise
 
         self.init_progerss()
-        full_text = ""
-        full_reasoning = ""
+        text_parts = []
+        reasoning_parts = []
         usage = None
                 
-        async for chunk in response:            
-            self.print_progress()
-            delta = chunk.choices[0].delta
-            if hasattr(delta, "reasoning_content") and delta.reasoning_content:
-                full_reasoning += delta.reasoning_content
-            if hasattr(delta, "content") and delta.content:
-                full_text += delta.content
-            if hasattr(chunk, "usage") and chunk.usage:
-                usage = {
-                    "input_tokens": chunk.usage.prompt_tokens,
-                    "output_tokens": chunk.usage.completion_tokens,
-                    "cache_read_tokens": 0,
-                    "cache_write_tokens": 0,
-                }
+        append_text = text_parts.append
+        append_reasoning = reasoning_parts.append
+        print_progress = self.print_progress
+        async with self.buffered_stream(response) as chunks:
+            async for chunk in chunks:
+                print_progress()
+                choices = chunk.choices
+                if choices:
+                    delta = choices[0].delta
+                    reasoning_content = getattr(delta, "reasoning_content", None)
+                    if reasoning_content:
+                        append_reasoning(reasoning_content)
+                    content = getattr(delta, "content", None)
+                    if content:
+                        append_text(content)
+                chunk_usage = getattr(chunk, "usage", None)
+                if chunk_usage:
+                    usage = {
+                        "input_tokens": chunk_usage.prompt_tokens,
+                        "output_tokens": chunk_usage.completion_tokens,
+                        "cache_read_tokens": 0,
+                        "cache_write_tokens": 0,
+                    }
         self.after_progerss()
+        full_reasoning = "".join(reasoning_parts)
 
         result = DotDict({
-            "text": full_text,
+            "text": "".join(text_parts),
             "usage": usage
         })
 
@@ -74,7 +87,9 @@ class TogetherOpennAIHandler(ApiHandlerBase):
 
     def remove_think_tags(self, text: str) -> str:
         """Removes content between <think> and </think> tags, including the tags themselves."""
-        return re.sub(r'<think>.*?</think>\s*', '', text, flags=re.DOTALL)
+        if '<think>' not in text:
+            return text
+        return _THINK_TAGS_RE.sub('', text)
 
     def get_model(self) -> Dict[str, Any]:
         model_id = self.options.get("model")
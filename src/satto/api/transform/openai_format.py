@@ -10,21 +10,21 @@ def convert_to_openai_messages(messages: List[Dict[str, Any]]) -> List[Dict[str,
         List of messages formatted for OpenAI chat completions API
     """
     openai_messages = []
-    
+    append = openai_messages.append
+
     for message in messages:
-        if isinstance(message.get("content"), list):
+        content = message.get("content", "")
+        content_type = type(content)
+        if content_type is str:
+            # Most history messages are plain strings, so check that first
+            pass
+        elif content_type is list:
             # Handle messages with multiple content parts
-            content_parts = []
-            for part in message["content"]:
-                if part.get("type") == "text":
-                    content_parts.append(part.get("text", ""))
-            content = "\n".join(content_parts)
-        else:
-            content = message.get("content", "")
-            
-        openai_messages.append({
+            content = "\n".join(part.get("text", "") for part in content if part.get("type") == "text")
+
+        append({
             "role": message.get("role", "user"),
             "content": content
         })
-        
+
     return openai_messages
@@ -1,5 +1,39 @@
+from itertools import groupby
+from operator import itemgetter
 from typing import Any, Dict, List, Union
 
+
+def _normalize_content(message_content: Union[str, List[Dict[str, Any]]]) -> Union[str, List[Dict[str, Any]]]:
+    """Convert a content array to OpenAI format, collapsing it to a string when it has no images."""
+    # Handle content arrays (for image support)
+    if not isinstance(message_content, list):
+        return message_content
+
+    text_parts = []
+    image_parts = []
+
+    for part in message_content:
+        if part["type"] == "text":
+            text_parts.append(part["text"])
+        elif part["type"] == "image":
+            source = part["source"]
+            image_parts.append({
+                "type": "image_url",
+                "image_url": {
+                    "url": f"data:{source['media_type']};base64,{source['data']}"
+                }
+            })
+
+    if not image_parts:
+        return "\n".join(text_parts)
+
+    parts = []
+    if text_parts:
+        parts.append({"type": "text", "text": "\n".join(text_parts)})
+    parts.extend(image_parts)
+    return parts
+
+
 def convert_to_r1_format(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Converts messages to OpenAI format while merging consecutive messages with the same role.
@@ -13,66 +47,32 @@ def convert_to_r1_format(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]
     """
     merged: List[Dict[str, Any]] = []
 
-    for message in messages:
-        message_content = message["content"]
-        
-        # Handle content arrays (for image support)
-        if isinstance(message_content, list):
-            text_parts = []
-            image_parts = []
-            has_images = False
-
-            for part in message_content:
-                if part["type"] == "text":
-                    text_parts.append(part["text"])
-                elif part["type"] == "image":
-                    has_images = True
-                    image_parts.append({
-                        "type": "image_url",
-                        "image_url": {
-                            "url": f"data:{part['source']['media_type']};base64,{part['source']['data']}"
-                        }
-                    })
-
-            if has_images:
-                parts = []
-                if text_parts:
-                    parts.append({"type": "text", "text": "\n".join(text_parts)})
-                parts.extend(image_parts)
-                message_content = parts
-            else:
-                message_content = "\n".join(text_parts)
-
-        # If last message has same role, merge the content
-        if merged and merged[-1]["role"] == message["role"]:
-            last_message = merged[-1]
-            
-            # Both are strings
-            if isinstance(last_message["content"], str) and isinstance(message_content, str):
-                last_message["content"] += f"\n{message_content}"
-            
-            # Handle array content (for images)
+    # Each run of consecutive same-role messages becomes one message, built in a single pass
+    for role, run in groupby(messages, key=itemgetter("role")):
+        contents = [_normalize_content(message["content"]) for message in run]
+
+        # Nothing to merge
+        if len(contents) == 1:
+            merged.append({"role": role, "content": contents[0]})
+            continue
+
+        # Only strings: join them once
+        first_list = next((i for i, content in enumerate(contents) if isinstance(content, list)), None)
+        if first_list is None:
+            merged.append({"role": role, "content": "\n".join(contents)})
+            continue
+
+        # Array content (for images): strings before the first array collapse into one text part,
+        # later strings become text parts of their own
+        merged_content = []
+        if first_list:
+            merged_content.append({"type": "text", "text": "\n".join(contents[:first_list])})
+        for content in contents[first_list:]:
+            if isinstance(content, list):
+                merged_content.extend(content)
             else:
-                last_content = (
-                    last_message["content"] 
-                    if isinstance(last_message["content"], list)
-                    else [{"type": "text", "text": last_message["content"] or ""}]
-                )
-                
-                new_content = (
-                    message_content
-                    if isinstance(message_content, list)
-                    else [{"type": "text", "text": message_content}]
-                )
-                
-                merged_content = [*last_content, *new_content]
-                last_message["content"] = merged_content
-
-        # Add as new message
-        else:
-            merged.append({
-                "role": message["role"],
-                "content": message_content
-            })
+                merged_content.append({"type": "text", "text": content})
+
+        merged.append({"role": role, "content": merged_content})
 
     return merged
@@ -35,19 +35,21 @@ class AttemptCompletionTool:
             result = params.get('result')
             command = params.get('command')
             
-            if not result:
+            # A whitespace-only result is as good as missing
+            if result is None or not result.strip():
                 return ToolResult(
                     success=False,
                     message="Missing required parameter: result",
                     content=None
                 )
 
-            message = "Task completion attempted"
             if command and self.satto:
                 # If a command was provided and we have a Satto instance,
                 # include the command in the message for execution
                 message = f"Task completion attempted. Command to demonstrate: {command}"
-            
+            else:
+                message = "Task completion attempted"
+
             return ToolResult(
                 success=True,
                 message=message,
@@ -1,4 +1,4 @@
-import subprocess
+import asyncio
 from pathlib import Path
 from typing import Dict, Optional
 from dataclasses import dataclass
@@ -100,32 +100,33 @@ class ExecuteCommandTool:
             command = params['command']
             requires_approval = params['requires_approval'].lower() == 'true'
 
-            try:
-                # Execute the command and capture output
-                result = subprocess.run(
-                    command,
-                    shell=True,  # Use shell to support command chaining and shell features
-                    cwd=self.working_directory,
-                    capture_output=True,
-                    text=True,
-                    check=True  # Raise CalledProcessError if command fails
-                )
-
-                return ToolResult(
-                    success=True,
-                    message=f"Command executed successfully: {command}",
-                    content=result.stdout if result.stdout else None
-                )
+            # Execute the command and capture output without blocking the event loop.
+            # Use shell to support command chaining and shell features
+            process = await asyncio.create_subprocess_shell(
+                command,
+                cwd=str(self.working_directory),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            stdout_bytes, stderr_bytes = await process.communicate()
+            stdout = stdout_bytes.decode(errors="replace")
+            stderr = stderr_bytes.decode(errors="replace")
 
-            except subprocess.CalledProcessError as e:
+            if process.returncode != 0:
                 # Command failed
-                error_message = e.stderr if e.stderr else str(e)
+                error_message = stderr if stderr else f"Command '{command}' returned non-zero exit status {process.returncode}."
                 return ToolResult(
                     success=False,
-                    message=f"Command failed with exit code {e.returncode}: {error_message}",
-                    content=e.stdout if e.stdout else None
+                    message=f"Command failed with exit code {process.returncode}: {error_message}",
+                    content=stdout if stdout else None
                 )
 
+            return ToolResult(
+                success=True,
+                message=f"Command executed successfully: {command}",
+                content=stdout if stdout else None
+            )
+
         except ValueError as e:
             return ToolResult(
                 success=False,
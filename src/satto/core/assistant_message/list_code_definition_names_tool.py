@@ -1,9 +1,23 @@
 import os
+import re
 import ast
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 
+from ...utils.path import is_within
+
+# Top-level JS/TS declarations: classes and functions, exported interfaces and types,
+# and const/let/var assignments. One alternation so the file is scanned in a single pass
+JS_TS_DEFINITION_RE = re.compile(
+    r'(?:class|function|export\s+interface|export\s+type)\s+(?P<name>\w+)'
+    r'|(?:const|let|var)\s+(?P<var>\w+)\s*='
+)
+
+# Upper bound on threads used to read and parse files in one directory
+MAX_PARSE_WORKERS = 8
+
 
 @dataclass
 class ToolResult:
@@ -21,8 +35,11 @@ class ListCodeDefinitionNamesTool:
         Args:
             working_directory: The base directory for all file operations
         """
-        self.working_directory = Path(working_directory)
+        self.working_directory = Path(working_directory).resolve()
+        self._root_prefix = os.path.join(str(self.working_directory), '')
         self.SUPPORTED_EXTENSIONS = {'.py', '.js', '.ts', '.jsx', '.tsx'}
+        # Parsed definitions per file path, stored with the (mtime_ns, size) they were parsed at
+        self._definitions_cache: Dict[str, Tuple[Tuple[int, int], List[str]]] = {}
 
     def _validate_path(self, dir_path: str) -> Path:
         """
@@ -41,9 +58,7 @@ class ListCodeDefinitionNamesTool:
         full_path = (self.working_directory / dir_path).resolve()
 
         # Check if path is within working directory
-        try:
-            full_path.relative_to(self.working_directory)
-        except ValueError:
+        if not is_within(self.working_directory, self._root_prefix, full_path):
             raise ValueError(f"Path '{dir_path}' is outside working directory")
 
         # Check if directory exists
@@ -60,16 +75,15 @@ class ListCodeDefinitionNamesTool:
         """Parse Python file for top-level definitions."""
         definitions = []
         try:
-            with file_path.open('r', encoding='utf-8') as f:
-                tree = ast.parse(f.read())
+            # The parser decodes bytes itself, so skip a separate read-and-decode step
+            tree = ast.parse(file_path.read_bytes(), filename=str(file_path))
 
-            for node in ast.iter_child_nodes(tree):
+            # Only top-level nodes are inspected
+            for node in tree.body:
                 if isinstance(node, (ast.ClassDef, ast.FunctionDef)):
                     definitions.append(node.name)
                 elif isinstance(node, ast.Assign):
-                    for target in node.targets:
-                        if isinstance(target, ast.Name):
-                            definitions.append(target.id)
+                    definitions.extend(target.id for target in node.targets if isinstance(target, ast.Name))
 
         except Exception as e:
             print(f"Error parsing Python file {file_path}: {str(e)}")
@@ -85,27 +99,10 @@ class ListCodeDefinitionNamesTool:
 
             # Simple regex-based parsing for demonstration
             # In a real implementation, you would use a proper JS/TS parser
-            import re
-            
-            # Match class, function, and const/let/var declarations
-            patterns = [
-                r'class\s+(\w+)',
-                r'function\s+(\w+)',
-                r'(const|let|var)\s+(\w+)\s*=',
-                r'export\s+(const|let|var)\s+(\w+)\s*=',
-                r'export\s+class\s+(\w+)',
-                r'export\s+function\s+(\w+)',
-                r'export\s+interface\s+(\w+)',
-                r'export\s+type\s+(\w+)',
-            ]
-
-            for pattern in patterns:
-                matches = re.finditer(pattern, content)
-                for match in matches:
-                    # Get the last group which contains the name
-                    name = match.groups()[-1]
-                    if name:
-                        definitions.append(name)
+            for match in JS_TS_DEFINITION_RE.finditer(content):
+                name = match.group('name') or match.group('var')
+                if name:
+                    definitions.append(name)
 
         except Exception as e:
             print(f"Error parsing JS/TS file {file_path}: {str(e)}")
@@ -113,18 +110,39 @@ class ListCodeDefinitionNamesTool:
         return definitions
 
     def _get_file_definitions(self, file_path: Path) -> List[str]:
-        """Get definitions from a file based on its extension."""
+        """Get definitions from a file based on its extension, reusing them while the file is unchanged."""
         ext = file_path.suffix.lower()
-        
+        if ext not in self.SUPPORTED_EXTENSIONS:
+            return []
+
+        stat = file_path.stat()
+        key = str(file_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._definitions_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
         if ext == '.py':
-            return self._parse_python_file(file_path)
-        elif ext in {'.js', '.ts', '.jsx', '.tsx'}:
-            return self._parse_js_ts_file(file_path)
-        
-        return []
+            definitions = self._parse_python_file(file_path)
+        else:
+            definitions = self._parse_js_ts_file(file_path)
+        # Sorted once here, so cache hits are formatted without sorting again
+        definitions.sort()
+
+        self._definitions_cache[key] = (signature, definitions)
+        return definitions
+
+    def _get_entry_definitions(self, entry: Path) -> Tuple[str, List[str]]:
+        """Get the path relative to the working directory and the definitions of a directory entry."""
+        rel_path = str(entry.relative_to(self.working_directory))
+        try:
+            return rel_path, self._get_file_definitions(entry)
+        except Exception as e:
+            print(f"Error reading file {entry}: {str(e)}")
+            return rel_path, []
 
     def _format_definitions(self, file_definitions: Dict[str, List[str]]) -> str:
-        """Format the definitions into a readable string."""
+        """Format the definitions, already sorted per file, into a readable string."""
         if not file_definitions:
             return "No definitions found."
 
@@ -132,8 +150,7 @@ class ListCodeDefinitionNamesTool:
         for file_path, definitions in sorted(file_definitions.items()):
             if definitions:
                 result.append(f"\nFile: {file_path}")
-                for definition in sorted(definitions):
-                    result.append(f"  {definition}")
+                result.extend(f"  {definition}" for definition in definitions)
 
         return "\n".join(result)
 
@@ -161,13 +178,22 @@ class ListCodeDefinitionNamesTool:
             # Find and parse source files
             file_definitions: Dict[str, List[str]] = {}
 
-            # Only process files in the top level of the directory
-            for entry in dir_path.iterdir():
-                if entry.is_file() and entry.suffix.lower() in self.SUPPORTED_EXTENSIONS:
-                    rel_path = entry.relative_to(self.working_directory)
-                    definitions = self._get_file_definitions(entry)
-                    if definitions:
-                        file_definitions[str(rel_path)] = definitions
+            # Only process files in the top level of the directory. scandir answers is_file()
+            # from the directory listing itself, without a stat() per entry
+            supported_suffixes = tuple(self.SUPPORTED_EXTENSIONS)
+            with os.scandir(dir_path) as it:
+                entries = [
+                    Path(entry.path) for entry in it
+                    if entry.name.lower().endswith(supported_suffixes) and entry.is_file()
+                ]
+
+            # Files are independent, so read and parse them concurrently
+            if entries:
+                max_workers = min(MAX_PARSE_WORKERS, os.cpu_count() or 1, len(entries))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    for rel_path, definitions in executor.map(self._get_entry_definitions, entries):
+                        if definitions:
+                            file_definitions[rel_path] = definitions
 
             # Format results
             content = self._format_definitions(file_definitions)
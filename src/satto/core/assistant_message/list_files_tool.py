@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Dict, Any, Optional
 
 from ...services.glob.list_files import list_files
-from ...services.config import Config
+from ...services.config import get_config
 
 @dataclass
 class ListFilesResult:
@@ -23,8 +23,23 @@ class ListFilesTool:
             cwd: Current working directory
         """
         self.cwd = cwd
-        self.list_files_config = Config().task_list_files
+        self.list_files_config = get_config().task_list_files
         
+    @staticmethod
+    def _to_display_path(file: str, path: str, prefix: str, prefix_len: int) -> str:
+        """Convert a listed path to a forward-slash path relative to the listed directory."""
+        if file.startswith(prefix) and len(file) > prefix_len:
+            return file[prefix_len:].replace(os.sep, '/')
+        try:
+            rel_path = os.path.relpath(file, path)
+        except ValueError:  # For paths on different drives
+            return file
+        # Keep forward slashes for consistency
+        rel_path = rel_path.replace(os.sep, '/')
+        if file.endswith('/'):  # Preserve directory markers
+            rel_path += '/'
+        return rel_path
+
     async def execute(self, params: Dict[str, Any]) -> ListFilesResult:
         """Execute the list_files tool.
         
@@ -63,20 +78,18 @@ class ListFilesTool:
             
             files, hit_limit = await list_files(path, recursive, limit, self.list_files_config)
             
-            # Convert absolute paths to relative for display
-            relative_files = []
-            for file in files:
-                try:
-                    rel_path = os.path.relpath(file, path)
-                    # Keep forward slashes for consistency
-                    rel_path = rel_path.replace(os.sep, '/')
-                    if file.endswith('/'):  # Preserve directory markers
-                        rel_path += '/'
-                    relative_files.append(rel_path)
-                except ValueError:  # For paths on different drives
-                    relative_files.append(file)
-                    
-            content = '\n'.join(relative_files)
+            # Convert absolute paths to relative for display. list_files returns paths under
+            # the absolute directory, so slicing off that prefix avoids os.path.relpath per file
+            prefix = os.path.join(os.path.abspath(path), '')
+            prefix_len = len(prefix)
+            if all(len(file) > prefix_len and file.startswith(prefix) for file in files):
+                # Common case: slice every path and convert separators once on the joined string.
+                # The slice keeps any trailing directory marker
+                content = '\n'.join([file[prefix_len:] for file in files])
+                if os.sep != '/':
+                    content = content.replace(os.sep, '/')
+            else:
+                content = '\n'.join([self._to_display_path(file, path, prefix, prefix_len) for file in files])
             message = "Files listed successfully"
             if hit_limit:
                 message += f"\nFile list truncated at {limit} entries"
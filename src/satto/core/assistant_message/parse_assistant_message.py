@@ -1,3 +1,4 @@
+import re
 from dataclasses import dataclass
 from typing import Dict, List, Literal, Optional, Union
 from enum import Enum
@@ -44,13 +45,18 @@ class ParamName(str, Enum):
 
 @dataclass
 class TextContent:
+    # One instance is built per parsed block, so skip the per-instance __dict__
+    __slots__ = ("type", "content", "block_type")
+
     type: Literal["text"]
     content: str
-    block_type: Optional[str] = None  # For special blocks like "thinking"
+    block_type: Optional[str]  # For special blocks like "thinking", None for plain text
 
 
 @dataclass
 class ToolUse:
+    __slots__ = ("type", "name", "params")
+
     type: Literal["tool_use"]
     name: ToolName
     params: Dict[ParamName, str]
@@ -58,6 +64,22 @@ class ToolUse:
 
 AssistantMessageContent = Union[TextContent, ToolUse]
 
+# Plain string names for the parser, the Enums are only read once here at import time
+_TOOL_NAMES = tuple(name.value for name in ToolName)
+_PARAM_NAMES = tuple(name.value for name in ParamName)
+
+# A single pattern matching any tool opening or closing tag, so the whole message is
+# tokenized in one scan instead of searched once per tool name
+_TOOL_TAG_RE = re.compile("<(/?)(" + "|".join(_TOOL_NAMES) + ")>")
+_TOOL_OPEN_TAGS = {f"<{name}>": name for name in _TOOL_NAMES}
+_TOOL_CLOSE_TAGS = {name: f"</{name}>" for name in _TOOL_NAMES}
+# All parameters in one pattern, the backreference pairs each opening tag with its own closing tag
+_PARAM_RE = re.compile(
+    "<(" + "|".join(_PARAM_NAMES) + r")>(.*?)</\1>",
+    re.DOTALL
+)
+_THINKING_RE = re.compile(r"<thinking>(.*?)</thinking>", re.DOTALL)
+
 
 def parse_assistant_message(message: str) -> List[AssistantMessageContent]:
     """
@@ -70,85 +92,71 @@ def parse_assistant_message(message: str) -> List[AssistantMessageContent]:
         List of TextContent and ToolUse blocks
     """
     blocks: List[AssistantMessageContent] = []
-    current_text = ""
+    # Text fragments are collected and joined once, rather than concatenated repeatedly
+    current_text: List[str] = []
 
     # Helper function to add accumulated text as a block
     def add_text_block():
-        nonlocal current_text
-        if current_text.strip():
-            # Check if this is a thinking block
-            text = current_text.strip()
-            if "<thinking>" in text and "</thinking>" in text:
-                # Extract all thinking blocks from the text
-                while "<thinking>" in text and "</thinking>" in text:
-                    start = text.find("<thinking>") + len("<thinking>")
-                    end = text.find("</thinking>")
-                    if start > 0 and end > start:
-                        # Get the content between thinking tags
-                        thinking_content = text[start:end].strip()
-                        blocks.append(TextContent(
-                            type="text",
-                            content=thinking_content,
-                            block_type="thinking"
-                        ))
-                        # Remove the processed thinking block
-                        text = text[end + len("</thinking>"):].strip()
-                
-                # Add any remaining non-thinking text
-                if text:
-                    blocks.append(TextContent(
-                        type="text",
-                        content=text
-                    ))
-            else:
+        text = "".join(current_text).strip()
+        current_text.clear()
+        if not text:
+            return
+
+        # Check if this contains thinking blocks
+        if "<thinking>" in text:
+            # Extract all thinking blocks from the text
+            found_thinking = False
+            for match in _THINKING_RE.finditer(text):
+                found_thinking = True
                 blocks.append(TextContent(
                     type="text",
-                    content=text
+                    content=match.group(1).strip(),
+                    block_type="thinking"
                 ))
-        current_text = ""
-
-    # Find all tool use blocks
-    while message:
-        # Look for the next tool opening tag
-        tool_start = -1
-        tool_name = None
-
-        for name in ToolName:
-            name = name.name.lower()
-            tag = f"<{name}>"
-            pos = message.find(tag)
-            if pos != -1 and (tool_start == -1 or pos < tool_start):
-                tool_start = pos
-                tool_name = name
-                break
-
-        if tool_start == -1:
-            # No more tools found, add remaining text
-            current_text += message
-            message = ""
-            continue
-
-        # Add text before the tool block
-        current_text += message[:tool_start]
-        add_text_block()
-
-        # Find the end of the tool block
-        tool_end = message.find(f"</{tool_name}>", tool_start)
-        if tool_end == -1:
-            # Incomplete tool block, treat as text
-            current_text += message[tool_start:]
-            message = ""
-            continue
-
-        tool_content = message[tool_start:tool_end + len(f"</{tool_name}>")]
-        message = message[tool_end + len(f"</{tool_name}>"):]
-
-        # Parse the tool block
-        tool_use = parse_tool_block(tool_content)
-        if tool_use:
-            blocks.append(tool_use)
+
+            if found_thinking:
+                # Keep any remaining non-thinking text
+                text = _THINKING_RE.sub("", text).strip()
+
+        if text:
+            blocks.append(TextContent(
+                type="text",
+                content=text,
+                block_type=None
+            ))
+
+    # Walk the tool tag tokens once. Outside a tool block the text between tokens is
+    # collected, inside one every token is skipped until the block's own closing tag
+    pos = 0  # End of the last consumed tool block
+    tool_name = None  # Name of the open tool block, None when outside one
+    tool_start = content_start = 0
+    for match in _TOOL_TAG_RE.finditer(message):
+        is_close, name = match.groups()
+        if tool_name is None:
+            if is_close:
+                # A stray closing tag is just text
+                continue
+            # Add text before the tool block
+            tool_start = match.start()
+            current_text.append(message[pos:tool_start])
+            add_text_block()
+            tool_name = name
+            content_start = match.end()
+        elif is_close and name == tool_name:
+            blocks.append(ToolUse(
+                type="tool_use",
+                name=tool_name,
+                params=_parse_params(message[content_start:match.start()])
+            ))
+            pos = match.end()
+            tool_name = None
+
+    if tool_name is not None:
+        # Incomplete tool block, treat as text
+        pos = tool_start
 
     # Add any remaining text
+    current_text.append(message[pos:])
     add_text_block()
 
     return blocks
@@ -164,43 +172,35 @@ def parse_tool_block(block: str) -> Optional[ToolUse]:
     Returns:
         ToolUse object if valid, None if invalid
     """
-    # Find the tool name
-    tool_name = None
-    for name in ToolName:
-        name = name.name.lower()
-        if block.startswith(f"<{name}>"):
-            tool_name = name
-            break
-
+    # Find the tool name from the opening tag
+    content_start = block.find(">") + 1
+    tool_name = _TOOL_OPEN_TAGS.get(block[:content_start])
     if not tool_name:
         return None
 
     # Extract the tool content (everything between the opening and closing tags)
-    content_start = block.find(">") + 1
-    content_end = block.rfind(f"</{tool_name}>")
+    content_end = block.rfind(_TOOL_CLOSE_TAGS[tool_name])
     if content_end == -1:
         return None
 
-    content = block[content_start:content_end]
-
-    # Parse parameters
-    params: Dict[ParamName, str] = {}
-    for param in ParamName:
-        param = param.name.lower()
-        param_start = content.find(f"<{param}>")
-        if param_start != -1:
-            param_end = content.find(f"</{param}>", param_start)
-            if param_end != -1:
-                param_value = content[param_start + len(f"<{param}>"):param_end].strip()
-                params[param] = param_value
-
     return ToolUse(
         type="tool_use",
         name=tool_name,
-        params=params
+        params=_parse_params(block[content_start:content_end])
     )
 
 
+def _parse_params(content: str) -> Dict[ParamName, str]:
+    """Extract the parameters from the content of a tool block in a single pass."""
+    params: Dict[ParamName, str] = {}
+    for param_match in _PARAM_RE.finditer(content):
+        # The first occurrence of each parameter wins
+        param = param_match.group(1)
+        if param not in params:
+            params[param] = param_match.group(2).strip()
+    return params
+
+
 # # Example usage:
 # if __name__ == "__main__":
 #     # Example assistant message with multiple tools
@@ -3,6 +3,8 @@ from pathlib import Path
 from typing import Dict, Optional
 from dataclasses import dataclass
 
+from ...utils.path import is_within
+
 
 @dataclass
 class ToolResult:
@@ -20,7 +22,8 @@ class ReadFileTool:
         Args:
             working_directory: The base directory for all file operations
         """
-        self.working_directory = Path(working_directory)
+        self.working_directory = Path(working_directory).resolve()
+        self._root_prefix = os.path.join(str(self.working_directory), '')
 
     def _validate_path(self, file_path: str) -> Path:
         """
@@ -39,9 +42,7 @@ class ReadFileTool:
         full_path = (self.working_directory / file_path).resolve()
 
         # Check if path is within working directory
-        try:
-            full_path.relative_to(self.working_directory)
-        except ValueError:
+        if not is_within(self.working_directory, self._root_prefix, full_path):
             raise ValueError(f"Path '{file_path}' is outside working directory")
 
         # Check if file exists
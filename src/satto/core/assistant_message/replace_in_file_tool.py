@@ -1,5 +1,11 @@
 import os
-from typing import Dict, Any, Optional
+import re
+import shutil
+import sys
+import tempfile
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 
 @dataclass
@@ -8,6 +14,20 @@ class ToolResult:
     message: str
     content: Optional[str] = None
 
+# SEARCH/REPLACE block markers, mapped to their role
+SEARCH_START, SEARCH_END, REPLACE_END = range(3)
+DIFF_MARKERS = {
+    '<<<<<<< SEARCH': SEARCH_START,
+    '=======': SEARCH_END,
+    '>>>>>>> REPLACE': REPLACE_END,
+}
+# A whole marker line, including its newline
+DIFF_MARKER_RE = re.compile(r'^(<<<<<<< SEARCH|=======|>>>>>>> REPLACE)$\n?', re.MULTILINE)
+
+def _line_offsets(lines: List[str]) -> List[int]:
+    """Return the character offset at which each line starts, plus one past the last line."""
+    return [0, *accumulate(len(line) + 1 for line in lines)]
+
 class ReplaceInFileTool:
     def __init__(self, cwd: str):
         self.cwd = cwd
@@ -43,31 +63,51 @@ class ReplaceInFileTool:
 
             abs_path = os.path.join(self.cwd, rel_path)
             
-            # Read original file content
-            try:
-                with open(abs_path, 'r', encoding='utf-8') as f:
-                    original_content = f.read()
-            except FileNotFoundError:
-                return ToolResult(
-                    success=False,
-                    message=f"File not found: {rel_path}",
-                    content=None
-                )
+            # A single block with an empty SEARCH replaces the whole file, so the
+            # original content does not need to be read at all
+            new_content = self._whole_file_replacement(diff_content)
+            original_bytes = None
+            if new_content is None or not os.path.isfile(abs_path):
+                # Read original file content in one read and decode it once. Newlines are
+                # translated as text mode would, so SEARCH blocks match CRLF files too
+                try:
+                    with open(abs_path, 'rb') as f:
+                        original_bytes = f.read()
+                    original_content = original_bytes.decode('utf-8')
+                    if '\r' in original_content:
+                        original_content = original_content.replace('\r\n', '\n').replace('\r', '\n')
+                except FileNotFoundError:
+                    return ToolResult(
+                        success=False,
+                        message=f"File not found: {rel_path}",
+                        content=None
+                    )
             
-            # Apply the diff
-            try:
-                new_content = self._construct_new_file_content(diff_content, original_content)
-            except Exception as e:
-                return ToolResult(
-                    success=False,
-                    message=f"Error applying diff: {str(e)}",
-                    content=None
-                )
+                # Apply the diff
+                try:
+                    new_content = self._construct_new_file_content(diff_content, original_content)
+                except Exception as e:
+                    return ToolResult(
+                        success=False,
+                        message=f"Error applying diff: {str(e)}",
+                        content=None
+                    )
             
-            # Write the modified content back to the file
+            # Write the modified content back to the file, with the platform's newlines
+            # as text mode would
             try:
-                with open(abs_path, 'w', encoding='utf-8') as f:
-                    f.write(new_content)
+                output = new_content
+                if os.linesep != '\n':
+                    output = output.replace('\n', os.linesep)
+                output_bytes = output.encode('utf-8')
+                # Leave the file untouched when the diff changes nothing
+                if output_bytes == original_bytes:
+                    return ToolResult(
+                        success=True,
+                        message=f"No changes to {rel_path}",
+                        content=f"Updated content:\n{new_content}"
+                    )
+                self._atomic_write(abs_path, output_bytes)
             except Exception as e:
                 return ToolResult(
                     success=False,
@@ -88,6 +128,78 @@ class ReplaceInFileTool:
                 content=None
             )
 
+    @staticmethod
+    def _atomic_write(abs_path: str, data: bytes) -> None:
+        """Write data to abs_path through a temporary file in the same directory.
+
+        The temporary file is renamed over the target, so a failed write never leaves
+        a half-written file behind. Symlinks are resolved first so the file behind the
+        link is replaced, and the original file's permissions and owner are kept.
+        Files a rename would detach from their other names or metadata (hard links,
+        extended attributes and ACLs, an owner that cannot be restored) are written in
+        place instead.
+        """
+        target = os.path.realpath(abs_path)
+        try:
+            st = os.stat(target)
+        except FileNotFoundError:
+            st = None
+
+        if st is not None and (st.st_nlink > 1 or (hasattr(os, 'listxattr') and os.listxattr(target))):
+            ReplaceInFileTool._write_in_place(target, data)
+            return
+
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target), prefix='.satto-', suffix='.tmp')
+        except PermissionError:
+            # The directory is read-only, but the file itself may still be writable
+            ReplaceInFileTool._write_in_place(target, data)
+            return
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            if st is not None:
+                shutil.copymode(target, tmp_path)
+                if hasattr(os, 'chown'):
+                    os.chown(tmp_path, st.st_uid, st.st_gid)
+            os.replace(tmp_path, target)
+        except PermissionError:
+            # Typically the owner of someone else's file cannot be restored
+            os.unlink(tmp_path)
+            ReplaceInFileTool._write_in_place(target, data)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    @staticmethod
+    def _write_in_place(path: str, data: bytes) -> None:
+        """Overwrite the file at path, keeping its inode and everything attached to it."""
+        with open(path, 'wb') as f:
+            f.write(data)
+
+    @staticmethod
+    def _whole_file_replacement(diff_content: str) -> Optional[str]:
+        """Return the new file content if the diff is one complete block with an empty SEARCH.
+
+        Such a diff replaces the whole file. Returns None for any other diff, including one
+        whose replacement contains marker lines, which is left to _construct_new_file_content.
+        """
+        prefix = '<<<<<<< SEARCH\n=======\n'
+        if not diff_content.startswith(prefix):
+            return None
+
+        replacement, sep, rest = diff_content[len(prefix):].partition('>>>>>>> REPLACE')
+        if not sep or rest not in ('', '\n') or (replacement and not replacement.endswith('\n')):
+            return None
+
+        if any(line in DIFF_MARKERS for line in replacement.split('\n')):
+            return None
+
+        return replacement
+
     def _construct_new_file_content(self, diff_content: str, original_content: str) -> str:
         """Reconstruct file content by applying SEARCH/REPLACE blocks.
         
@@ -98,35 +210,56 @@ class ReplaceInFileTool:
         Returns:
             New file content with replacements applied
         """
-        result = ""
+        # Output and block contents are collected as lists and joined once
+        result_parts = []
         last_processed_index = 0
         
-        current_search_content = ""
-        current_replace_content = ""
+        search_parts = []
         in_search = False
         in_replace = False
         
         search_match_index = -1
         search_end_index = -1
+
+        # Line split, trimmed lines and line offsets of the original content for the fuzzy
+        # matchers, built on first use and shared by every SEARCH block
+        line_index = None
+        # Trimmed line -> ascending line numbers where it occurs, for the anchor matcher
+        anchor_index = None
+
+        # Exact-match results per SEARCH content, as (start index, found index). A result
+        # still answers a later search from a start at or past the cached start, as long as
+        # it was a miss or lies at or past that later start
+        find_cache: Dict[str, Tuple[int, int]] = {}
+        find = original_content.find
         
-        lines = diff_content.split('\n')
-        
-        # Handle partial markers at the end
-        if lines and any(
-            lines[-1].startswith(prefix) for prefix in ('<', '=', '>')
-        ) and lines[-1] not in ('<<<<<<< SEARCH', '=======', '>>>>>>> REPLACE'):
-            lines.pop()
-            
-        for line in lines:
-            if line == '<<<<<<< SEARCH':
+        # Content between marker lines is handled a whole chunk at a time
+        def add_content(chunk: str) -> None:
+            if not chunk:
+                return
+            if in_search:
+                search_parts.append(chunk)
+            elif in_replace:
+                # The match position is always known once a SEARCH block has ended, so
+                # replacement chunks are emitted as they come, covering an unterminated block
+                result_parts.append(chunk)
+
+        pos = 0
+        for marker_match in DIFF_MARKER_RE.finditer(diff_content):
+            # Marker lines start right after a newline, so the chunk is made of whole lines
+            add_content(diff_content[pos:marker_match.start()])
+            pos = marker_match.end()
+            marker = DIFF_MARKERS[marker_match.group(1)]
+
+            if marker == SEARCH_START:
                 in_search = True
-                current_search_content = ""
-                current_replace_content = ""
+                search_parts = []
                 continue
                 
-            if line == '=======':
+            if marker == SEARCH_END:
                 in_search = False
                 in_replace = True
+                current_search_content = "".join(search_parts)
                 
                 if not current_search_content:
                     # Empty search block
@@ -140,15 +273,28 @@ class ReplaceInFileTool:
                         search_end_index = len(original_content)
                 else:
                     # Try exact match first
-                    search_match_index = original_content.find(
-                        current_search_content, 
-                        last_processed_index
-                    )
+                    cached = find_cache.get(current_search_content)
+                    if (cached is not None and cached[0] <= last_processed_index
+                            and (cached[1] == -1 or cached[1] >= last_processed_index)):
+                        search_match_index = cached[1]
+                    else:
+                        search_match_index = find(current_search_content, last_processed_index)
+                        find_cache[current_search_content] = (last_processed_index, search_match_index)
                     
                     if search_match_index == -1:
+                        if line_index is None:
+                            original_lines = original_content.split('\n')
+                            # Interned, so repeated lines (blank lines, braces, ...) share one object
+                            # and compare equal by identity
+                            line_index = (
+                                original_lines,
+                                [sys.intern(original_line.strip()) for original_line in original_lines],
+                                _line_offsets(original_lines),
+                            )
+
                         # Try line-trimmed match
                         match = self._line_trimmed_match(
-                            original_content,
+                            *line_index,
                             current_search_content,
                             last_processed_index
                         )
@@ -157,8 +303,14 @@ class ReplaceInFileTool:
                             search_match_index, search_end_index = match
                         else:
                             # Try block anchor match for 3+ lines
+                            if anchor_index is None:
+                                anchor_index = {}
+                                for line_num, stripped_line in enumerate(line_index[1]):
+                                    anchor_index.setdefault(stripped_line, []).append(line_num)
+
                             match = self._block_anchor_match(
-                                original_content,
+                                *line_index,
+                                anchor_index,
                                 current_search_content,
                                 last_processed_index
                             )
@@ -174,89 +326,98 @@ class ReplaceInFileTool:
                         search_end_index = search_match_index + len(current_search_content)
                 
                 # Output everything up to match location
-                result += original_content[last_processed_index:search_match_index]
+                result_parts.append(original_content[last_processed_index:search_match_index])
                 continue
                 
-            if line == '>>>>>>> REPLACE':
+            if marker == REPLACE_END:
                 # Advance last_processed_index past matched section
                 last_processed_index = search_end_index
                 
                 # Reset for next block
                 in_search = False
                 in_replace = False
-                current_search_content = ""
-                current_replace_content = ""
+                search_parts = []
                 search_match_index = -1
                 search_end_index = -1
                 continue
+
+        # Content after the last marker. A diff ending in a marker without a newline has none,
+        # otherwise the last line counts as newline-terminated even when it is not
+        rest = diff_content[pos:]
+        if rest or pos == 0 or diff_content[pos - 1] == '\n':
+            last_line_start = rest.rfind('\n') + 1
+            if rest.startswith(('<', '=', '>'), last_line_start):
+                # Drop a partial marker at the end
+                add_content(rest[:last_line_start])
+            else:
+                add_content(rest + '\n')
                 
-            # Accumulate content
-            if in_search:
-                current_search_content += line + '\n'
-            elif in_replace:
-                current_replace_content += line + '\n'
-                # Output replacement lines immediately if insertion point known
-                if search_match_index != -1:
-                    result += line + '\n'
-                    
         # Append any remaining original content
         if last_processed_index < len(original_content):
-            result += original_content[last_processed_index:]
+            result_parts.append(original_content[last_processed_index:])
             
-        return result
+        return "".join(result_parts)
 
     def _line_trimmed_match(
         self, 
-        original_content: str,
+        original_lines: List[str],
+        stripped_lines: List[str],
+        offsets: List[int],
         search_content: str, 
         start_index: int
     ) -> Optional[tuple[int, int]]:
-        """Find match by comparing trimmed lines."""
-        original_lines = original_content.split('\n')
+        """Find match by comparing trimmed lines.
+
+        original_lines, stripped_lines and offsets are the original content split into lines,
+        those lines trimmed, and the character offset at which each line starts.
+        """
         search_lines = search_content.split('\n')
         
         # Remove empty trailing line
         if search_lines[-1] == "":
             search_lines.pop()
             
-        # Find starting line number
-        start_line_num = 0
-        current_index = 0
-        while current_index < start_index and start_line_num < len(original_lines):
-            current_index += len(original_lines[start_line_num]) + 1
-            start_line_num += 1
-            
-        # Try to match at each position
-        for i in range(start_line_num, len(original_lines) - len(search_lines) + 1):
-            matches = True
+        # Find starting line number: the first line starting at or after start_index
+        start_line_num = bisect_left(offsets, start_index)
             
-            for j in range(len(search_lines)):
-                if original_lines[i + j].strip() != search_lines[j].strip():
-                    matches = False
-                    break
-                    
-            if matches:
+        # Boyer-Moore-Horspool search where each trimmed line acts as one character
+        haystack = stripped_lines
+        needle = [sys.intern(line.strip()) for line in search_lines]
+        needle_len = len(needle)
+        last = needle_len - 1
+
+        # How far the window may move when its last line is a given line. Later occurrences
+        # in the needle overwrite earlier ones, giving the smallest safe shift
+        shift = {line: last - idx for idx, line in enumerate(needle[:-1])}
+
+        i = start_line_num
+        end = len(haystack) - needle_len
+        while i <= end:
+            # Compare from the last line backwards
+            j = last
+            while j >= 0 and haystack[i + j] == needle[j]:
+                j -= 1
+            if j < 0:
                 # Calculate character positions
-                match_start = 0
-                for k in range(i):
-                    match_start += len(original_lines[k]) + 1
-                    
-                match_end = match_start
-                for k in range(len(search_lines)):
-                    match_end += len(original_lines[i + k]) + 1
-                    
-                return (match_start, match_end)
+                return (offsets[i], offsets[i + needle_len])
+            i += shift.get(haystack[i + last], needle_len)
                 
         return None
 
     def _block_anchor_match(
         self,
-        original_content: str,
+        original_lines: List[str],
+        stripped_lines: List[str],
+        offsets: List[int],
+        anchor_index: Dict[str, List[int]],
         search_content: str,
         start_index: int
     ) -> Optional[tuple[int, int]]:
-        """Find match using first/last lines as anchors."""
-        original_lines = original_content.split('\n')
+        """Find match using first/last lines as anchors.
+
+        Takes the same precomputed line data as _line_trimmed_match, plus anchor_index
+        mapping each trimmed line to the ascending line numbers it occurs at.
+        """
         search_lines = search_content.split('\n')
         
         # Only use for 3+ line blocks
@@ -268,33 +429,23 @@ class ReplaceInFileTool:
             search_lines.pop()
             
         first_line_search = search_lines[0].strip()
-        last_line_search = search_lines[-1].strip()
+        last_line_search = sys.intern(search_lines[-1].strip())
         search_block_size = len(search_lines)
         
-        # Find starting line number
-        start_line_num = 0
-        current_index = 0
-        while current_index < start_index and start_line_num < len(original_lines):
-            current_index += len(original_lines[start_line_num]) + 1
-            start_line_num += 1
+        # Find starting line number: the first line starting at or after start_index
+        start_line_num = bisect_left(offsets, start_index)
             
-        # Look for matching anchors
-        for i in range(start_line_num, len(original_lines) - search_block_size + 1):
-            if original_lines[i].strip() != first_line_search:
-                continue
+        # Look for matching anchors, only visiting lines equal to the first anchor
+        candidates = anchor_index.get(first_line_search, ())
+        last_start = len(original_lines) - search_block_size
+        for i in candidates[bisect_left(candidates, start_line_num):]:
+            if i > last_start:
+                break
                 
-            if original_lines[i + search_block_size - 1].strip() != last_line_search:
+            if stripped_lines[i + search_block_size - 1] != last_line_search:
                 continue
                 
             # Calculate character positions
-            match_start = 0
-            for k in range(i):
-                match_start += len(original_lines[k]) + 1
-                
-            match_end = match_start
-            for k in range(search_block_size):
-                match_end += len(original_lines[i + k]) + 1
-                
-            return (match_start, match_end)
+            return (offsets[i], offsets[i + search_block_size])
             
         return None
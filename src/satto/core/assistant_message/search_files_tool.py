@@ -57,13 +57,6 @@ class SearchFilesTool:
             if not os.path.isabs(path):
                 path = os.path.join(self.cwd, path)
                 
-            # Verify the directory exists
-            if not os.path.exists(path):
-                return SearchFilesResult(
-                    success=False,
-                    message=f"Directory does not exist: {path}"
-                )
-
             file_pattern = params.get('file_pattern')
             
             content = await regex_search_files(
@@ -72,6 +65,14 @@ class SearchFilesTool:
                 regex=regex,
                 file_pattern=file_pattern
             )
+
+            # ripgrep itself fails on a missing path, so the directory is only checked
+            # when the search came back empty or failed
+            if (content == "No results found" or content.startswith("Error:")) and not os.path.exists(path):
+                return SearchFilesResult(
+                    success=False,
+                    message=f"Directory does not exist: {path}"
+                )
             
             return SearchFilesResult(
                 success=True,
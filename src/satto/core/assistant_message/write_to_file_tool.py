@@ -4,6 +4,8 @@ from typing import Dict, Optional, Tuple, Union
 from dataclasses import dataclass
 import difflib
 
+from ...utils.path import is_within
+
 
 @dataclass
 class FileChange:
@@ -30,7 +32,8 @@ class WriteToFileTool:
         Args:
             working_directory: The base directory for all file operations
         """
-        self.working_directory = Path(working_directory)
+        self.working_directory = Path(working_directory).resolve()
+        self._root_prefix = os.path.join(str(self.working_directory), '')
 
     def _validate_path(self, file_path: str) -> Tuple[Path, bool]:
         """
@@ -49,9 +52,7 @@ class WriteToFileTool:
         full_path = (self.working_directory / file_path).resolve()
 
         # Check if path is within working directory
-        try:
-            full_path.relative_to(self.working_directory)
-        except ValueError:
+        if not is_within(self.working_directory, self._root_prefix, full_path):
             raise ValueError(f"Path '{file_path}' is outside working directory")
 
         return full_path, full_path.exists()
@@ -1,7 +1,10 @@
 import os
 import asyncio
+import itertools
 import json
+import sys
 import time
+from functools import cached_property
 from typing import Dict, Any, Optional, AsyncGenerator, Union, List, cast
 from weakref import WeakValueDictionary, ref
 from typing_extensions import Protocol
@@ -18,10 +21,12 @@ from .prompts.responses import (
     format_files_list
 )
 from ..utils.history import (
-    save_api_conversation_history,
-    load_api_conversation_history,
-    save_satto_messages,
-    load_satto_messages,
+    save_api_conversation_history_async,
+    append_api_conversation_message_async,
+    load_api_conversation_history_async,
+    migrate_legacy_api_conversation_history_async,
+    save_satto_messages_async,
+    load_satto_messages_async,
     get_latest_task,
     get_latest_task_id
 )
@@ -29,7 +34,7 @@ from ..utils.log_print import LogPrint
 from ..utils.cost import calculate_api_cost
 from ..utils.history import save_llm_response
 from ..utils.string import fix_model_html_escaping, remove_invalid_chars
-from ..services.config import Config
+from ..services.config import get_config
 from ..api.api_handler import build_api_handler
 from ..shared.api import ApiConfiguration
 from ..shared.dicts import DotDict
@@ -49,6 +54,177 @@ from .assistant_message.plan_mode_response_tool import PlanModeResponseTool
 
 log_print = LogPrint()
 
+# Tools Satto can run, each through its self.<name>_tool instance
+EXECUTABLE_TOOLS = frozenset((
+    "write_to_file",
+    "read_file",
+    "list_files",
+    "search_files",
+    "list_code_definition_names",
+    "replace_in_file",
+    "attempt_completion",
+    "execute_command",
+    "ask_followup_question",
+    "plan_mode_response",
+))
+
+# Tools whose execute method is a coroutine
+ASYNC_TOOLS = frozenset(("list_files", "search_files", "execute_command"))
+
+# Tool -> auto-approval action that covers it
+TOOL_APPROVAL_ACTIONS = {
+    "read_file": "read_files",
+    "list_files": "read_files",
+    "list_code_definition_names": "read_files",
+    "search_files": "read_files",
+    "write_to_file": "edit_files",
+    "replace_in_file": "edit_files",
+    "execute_command": "execute_commands",
+    "browser_action": "use_browser",
+    "access_mcp_resource": "use_mcp",
+    "use_mcp_tool": "use_mcp",
+    "attempt_completion": "attempt_completion",
+}
+
+# Tools whose successful result ends the current request loop
+TERMINAL_TOOLS = frozenset(("attempt_completion", "ask_followup_question", "execute_command"))
+
+# Tool -> parameter holding model-written text that is cleaned up before the tool runs
+MODEL_TEXT_PARAMS = {
+    "write_to_file": "content",
+    "replace_in_file": "diff",
+}
+
+# Tool -> parameter quoted in the tool's result description
+DESCRIPTION_PARAMS = {
+    "write_to_file": "path",
+    "read_file": "path",
+    "list_files": "path",
+    "search_files": "path",
+    "list_code_definition_names": "path",
+    "replace_in_file": "path",
+    "execute_command": "command",
+    "ask_followup_question": "question",
+}
+
+def _write_to_file_notification(params: Dict[str, Any], cwd: str) -> str:
+    """Build the approval notification for write_to_file, which depends on whether the file exists."""
+    path = params.get('path', '')
+    action = 'edit' if os.path.exists(os.path.join(cwd, path)) else 'create'
+    return f"Satto wants to {action} {os.path.basename(path)}"
+
+# Tool -> builder of the notification shown when the tool needs approval, given the tool
+# parameters and the working directory. A builder may return None for no notification
+APPROVAL_NOTIFICATIONS = {
+    "write_to_file": _write_to_file_notification,
+    "replace_in_file": lambda params, cwd: f"Satto wants to edit {os.path.basename(params.get('path', ''))}",
+    "read_file": lambda params, cwd: f"Satto wants to read {os.path.basename(params.get('path', ''))}",
+    "list_files": lambda params, cwd: f"Satto wants to view directory {os.path.basename(params.get('path', ''))}/",
+    "search_files": lambda params, cwd: f"Satto wants to search files in {os.path.basename(params.get('path', ''))}/",
+    "execute_command": lambda params, cwd: f"Satto wants to execute a command: {params.get('command', '')}",
+    "browser_action": lambda params, cwd: (
+        f"Satto wants to use a browser and launch {params.get('url', '')}"
+        if params.get('action') == "launch" else None
+    ),
+    "use_mcp_tool": lambda params, cwd: (
+        f"Satto wants to use {params.get('tool_name', '')} on {params.get('server_name', '')}"
+    ),
+    "access_mcp_resource": lambda params, cwd: (
+        f"Satto wants to access {params.get('uri', '')} on {params.get('server_name', '')}"
+    ),
+}
+
+# Answer typed at a y/n prompt -> response returned by Satto.ask
+ASK_RESPONSES = {
+    "y": "yesClicked",
+    "yes": "yesClicked",
+    "n": "noClicked",
+    "no": "noClicked",
+}
+
+# Delay before a scheduled history save runs, so a burst of updates is written once
+SAVE_DEBOUNCE_SECONDS = 0.25
+
+
+# Distinguishes tasks started by this process within the same second
+_task_counter = itertools.count()
+
+
+def new_task_id() -> str:
+    """Return a new task ID: the start time in seconds, the process ID and a per-process counter.
+
+    The timestamp comes first, so history code can still read it from the ID.
+    """
+    return f"{int(time.time())}-{os.getpid()}-{next(_task_counter)}"
+
+
+# Bytes read from an interactive stdin that are not yet part of a returned line, e.g.
+# the remaining lines of a multi-line paste
+_pending_input = bytearray()
+
+
+def _take_pending_line() -> Optional[str]:
+    """Remove and return the first complete line in _pending_input, if there is one."""
+    end = _pending_input.find(b"\n")
+    if end < 0:
+        return None
+    line = bytes(_pending_input[:end])
+    del _pending_input[:end + 1]
+    return line.decode(sys.stdin.encoding or "utf-8", errors="replace").rstrip("\r")
+
+
+async def read_input(prompt: str) -> str:
+    """Read a line from stdin like input(), letting other tasks run while the user types.
+
+    On an interactive terminal the event loop watches stdin and reads it with os.read,
+    so no thread is left blocked in input() and Ctrl-C interrupts the prompt at once.
+    Lines are split here rather than by sys.stdin, whose buffer the event loop cannot
+    see: extra pasted lines are kept in _pending_input and returned by the next calls
+    without waiting. Elsewhere (piped input, event loops without add_reader) input()
+    runs in a worker thread.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        fd = sys.stdin.fileno()
+        interactive = sys.stdin.isatty()
+    except (AttributeError, ValueError, OSError):
+        interactive = False
+    if not interactive:
+        return await asyncio.to_thread(input, prompt)
+
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = _take_pending_line()
+    if line is not None:
+        return line
+
+    future = loop.create_future()
+
+    def on_readable():
+        if future.done():
+            return
+        data = os.read(fd, 4096)
+        if not data:
+            if not _pending_input:
+                future.set_exception(EOFError("EOF when reading a line"))
+                return
+            # End of input without a trailing newline ends the last line
+            _pending_input.extend(b"\n")
+        _pending_input.extend(data)
+        line = _take_pending_line()
+        if line is not None:
+            future.set_result(line)
+
+    try:
+        loop.add_reader(fd, on_readable)
+    except NotImplementedError:
+        return await asyncio.to_thread(input, "")
+
+    try:
+        return await future
+    finally:
+        loop.remove_reader(fd)
+
 
 class Satto:
     def __init__(self, task_id: Optional[str] = None, load_latest: bool = True):
@@ -58,7 +234,7 @@ class Satto:
             task_id: Optional task ID for resuming an existing task. If not provided and load_latest is True, will attempt to load latest task ID.
             load_latest: Whether to load the latest task ID if no task_id is provided. Note that actual task history loading is handled by resume_task().
         """
-        self.config = Config()
+        self.config = get_config()
         self.api_provider = self.config.api_provider
         self.max_consecutive_mistake_count = self.config.max_consecutive_mistake_count
         self.cwd = os.getcwd()
@@ -78,9 +254,9 @@ class Satto:
             if latest_task:
                 self.task_id = latest_task["id"]
             else:
-                self.task_id = str(int(time.time()))
+                self.task_id = new_task_id()
         else:
-            self.task_id = task_id or str(int(time.time()))
+            self.task_id = task_id or new_task_id()
                 
         # Track API total usage cost
         self.total_input_tokens = 0
@@ -88,27 +264,68 @@ class Satto:
         self.total_cache_writes = 0
         self.total_cache_reads = 0
         
-        # Initialize tools
-        self.write_to_file_tool = WriteToFileTool(self.cwd)
-        self.read_file_tool = ReadFileTool(self.cwd)
-        self.list_files_tool = ListFilesTool(self.cwd)
-        self.search_files_tool = SearchFilesTool(self.cwd)
-        self.list_code_definition_names_tool = ListCodeDefinitionNamesTool(self.cwd)
-        self.replace_in_file_tool = ReplaceInFileTool(self.cwd)
-        self.attempt_completion_tool = AttemptCompletionTool(self.cwd)
-        self.execute_command_tool = ExecuteCommandTool(self.cwd, self)
-        self.ask_followup_question_tool = AskFollowupQuestionTool(self.cwd)
-        self.plan_mode_response_tool = PlanModeResponseTool(self.cwd)
-        self.attempt_completion_tool.set_satto(self)
+        # Tools are created on first use, see the *_tool properties below
 
         self.consecutive_mistake_count = 0
         self.satto_messages = []
+        # Whether satto_messages changed since it was last saved or loaded. Code that
+        # changes the messages sets it, so unchanged messages are not rewritten
+        self.satto_messages_dirty = True
         self.api_conversation_history = []
         self.conversation_history_deleted_range = None
         self.is_waiting_for_first_chunk = False
         self.did_automatically_retry_failed_api_request = False        
+        # (inputs, prompt) of the last built system prompt, reused while the inputs are unchanged
+        self._system_prompt_cache = None
+        # Save method -> its pending debounced save task, and the saves requested meanwhile
+        self._pending_saves = {}
+        self._dirty_saves = set()
         self.api_handler = build_api_handler(self.api_provider)
 
+    # Tools, each created the first time a task uses it. A tool use named X runs self.X_tool
+
+    @cached_property
+    def write_to_file_tool(self) -> WriteToFileTool:
+        return WriteToFileTool(self.cwd)
+
+    @cached_property
+    def read_file_tool(self) -> ReadFileTool:
+        return ReadFileTool(self.cwd)
+
+    @cached_property
+    def list_files_tool(self) -> ListFilesTool:
+        return ListFilesTool(self.cwd)
+
+    @cached_property
+    def search_files_tool(self) -> SearchFilesTool:
+        return SearchFilesTool(self.cwd)
+
+    @cached_property
+    def list_code_definition_names_tool(self) -> ListCodeDefinitionNamesTool:
+        return ListCodeDefinitionNamesTool(self.cwd)
+
+    @cached_property
+    def replace_in_file_tool(self) -> ReplaceInFileTool:
+        return ReplaceInFileTool(self.cwd)
+
+    @cached_property
+    def attempt_completion_tool(self) -> AttemptCompletionTool:
+        tool = AttemptCompletionTool(self.cwd)
+        tool.set_satto(self)
+        return tool
+
+    @cached_property
+    def execute_command_tool(self) -> ExecuteCommandTool:
+        return ExecuteCommandTool(self.cwd, self)
+
+    @cached_property
+    def ask_followup_question_tool(self) -> AskFollowupQuestionTool:
+        return AskFollowupQuestionTool(self.cwd)
+
+    @cached_property
+    def plan_mode_response_tool(self) -> PlanModeResponseTool:
+        return PlanModeResponseTool(self.cwd)
+
     def get_task_id(self) -> Optional[str]:
         """Get the ID of the most recent task.
         
@@ -118,26 +335,59 @@ class Satto:
         return get_latest_task_id()
     
     async def add_to_api_conversation_history(self, message: Dict) -> None:
-        """Add a message to the API conversation history and save it.
+        """Add a message to the API conversation history and append it to the saved history.
         
         Args:
             message: The message to add
         """
         self.api_conversation_history.append(message)
-        await self.save_api_conversation_history()
+        try:
+            await append_api_conversation_message_async(self.task_id, message)
+        except Exception as e:
+            print(f"Failed to save API conversation history: {e}")
+
+    def schedule_save(self, save) -> None:
+        """Request a save that runs shortly, coalescing repeated requests into one write.
+
+        Args:
+            save: The save coroutine method to run, e.g. self.save_satto_messages
+        """
+        self._dirty_saves.add(save)
+        if save not in self._pending_saves:
+            self._pending_saves[save] = asyncio.create_task(self._debounced_save(save))
+
+    async def _debounced_save(self, save) -> None:
+        """Run save after the debounce delay, again if more saves were requested meanwhile."""
+        try:
+            while save in self._dirty_saves:
+                await asyncio.sleep(SAVE_DEBOUNCE_SECONDS)
+                self._dirty_saves.discard(save)
+                await save()
+        finally:
+            del self._pending_saves[save]
+
+    async def flush_saves(self) -> None:
+        """Wait until every scheduled save has been written."""
+        while self._pending_saves:
+            await asyncio.gather(*self._pending_saves.values())
 
     async def save_api_conversation_history(self) -> None:
         """Save the current API conversation history to disk."""
         try:
-            save_api_conversation_history(self.task_id, self.api_conversation_history)
+            # The list is copied since it is serialized on another thread
+            await save_api_conversation_history_async(self.task_id, list(self.api_conversation_history))
         except Exception as e:
             print(f"Failed to save API conversation history: {e}")
 
     async def save_satto_messages(self) -> None:
-        """Save the current Satto UI messages to disk."""
+        """Save the current Satto UI messages to disk, unless they are unchanged since the last save."""
+        if not self.satto_messages_dirty:
+            return
+        self.satto_messages_dirty = False
         try:
-            save_satto_messages(self.task_id, self.satto_messages)
+            await save_satto_messages_async(self.task_id, list(self.satto_messages))
         except Exception as e:
+            self.satto_messages_dirty = True
             print(f"Failed to save Satto messages: {e}")
 
     async def get_response(self, prompt: str) -> str:
@@ -161,9 +411,11 @@ class Satto:
             task: The task description
         """
         # Always generate new task_id for new tasks
-        self.task_id = str(int(time.time()))
+        self.task_id = new_task_id()
         self.satto_messages = []
+        self.satto_messages_dirty = True
         self.api_conversation_history = []
+        self._system_prompt_cache = None
         
         return await self.initiate_task_loop([
             {
@@ -180,12 +432,14 @@ class Satto:
         """
         # First set the task
         self.task = task
+        self._system_prompt_cache = None
         
         # Then try to load history
         if not await self.load_history():
             # If no history found, start a new task instead
-            self.task_id = str(int(time.time()))
+            self.task_id = new_task_id()
             self.satto_messages = []
+            self.satto_messages_dirty = True
             self.api_conversation_history = []
             
         return await self.initiate_task_loop([
@@ -198,21 +452,25 @@ class Satto:
     async def initiate_task_loop(self, user_content, is_new_task):
         next_user_content = user_content
         include_file_details = True
-        while not self.abort:
-            did_end_loop = await self.recursively_make_satto_requests(next_user_content,
-                                                                      include_file_details,
-                                                                      is_new_task)
+        try:
+            while not self.abort:
+                did_end_loop = await self.recursively_make_satto_requests(next_user_content,
+                                                                          include_file_details,
+                                                                          is_new_task)
 
-            if did_end_loop:
-                break
+                if did_end_loop:
+                    break
 
-            next_user_content = [
-                {
-                    "type": "text",
-                    "text": format_no_tools_used()
-                }
-            ]
-            self.consecutive_mistake_count += 1
+                next_user_content = [
+                    {
+                        "type": "text",
+                        "text": format_no_tools_used()
+                    }
+                ]
+                self.consecutive_mistake_count += 1
+        finally:
+            # Write out history updates still waiting on their debounce delay
+            await self.flush_saves()
 
     def should_auto_approve_tool(self, tool_name: str) -> bool:
         """Check if a tool should be auto-approved based on settings.
@@ -224,18 +482,9 @@ class Satto:
             bool: Whether the tool should be auto-approved
         """
         if self.auto_approval_settings.enabled:
-            if tool_name in ["read_file", "list_files", "list_code_definition_names", "search_files"]:
-                return self.auto_approval_settings.actions['read_files']
-            elif tool_name in ["write_to_file", "replace_in_file"]:
-                return self.auto_approval_settings.actions['edit_files']
-            elif tool_name == "execute_command":
-                return self.auto_approval_settings.actions['execute_commands']
-            elif tool_name == "browser_action":
-                return self.auto_approval_settings.actions['use_browser']
-            elif tool_name in ["access_mcp_resource", "use_mcp_tool"]:
-                return self.auto_approval_settings.actions['use_mcp']
-            elif tool_name == "attempt_completion":
-                return self.auto_approval_settings.actions['attempt_completion']
+            action = TOOL_APPROVAL_ACTIONS.get(tool_name)
+            if action is not None:
+                return self.auto_approval_settings.actions[action]
         return False
 
     def show_notification(self, subtitle: str, message: str) -> None:
@@ -251,7 +500,34 @@ class Satto:
             # For now we just print to console
         print(f"{subtitle}: {message}")
 
-    async def recursively_make_satto_requests(self, user_content, include_file_details, is_new_task):     
+    async def recursively_make_satto_requests(self, user_content, include_file_details, is_new_task):
+        """Make requests until a response uses no more tools or ends the task.
+
+        Each round's tool results become the next request's user content. The rounds run
+        in a loop rather than through recursion, so a long task does not keep every
+        earlier round's frame alive.
+
+        Returns:
+            bool: Whether the task loop should end
+        """
+        while True:
+            did_end_loop, next_user_content = await self._make_satto_request(user_content,
+                                                                             include_file_details,
+                                                                             is_new_task)
+            if next_user_content is None:
+                return did_end_loop
+
+            user_content = next_user_content
+            include_file_details = False
+            is_new_task = False
+
+    async def _make_satto_request(self, user_content, include_file_details, is_new_task):
+        """Make one request and run the tools it uses.
+
+        Returns:
+            Tuple of whether the task loop should end, and the tool results to send in the
+            next request, or None when there is no next request
+        """
         if self.abort:
             raise Exception("Satto instance aborted")
 
@@ -266,7 +542,7 @@ class Satto:
                     "text": format_too_many_mistakes("You seem to be having trouble. Please review the previous messages and try again.")
                 }
             ]
-            return True
+            return True, None
 
         if (self.auto_approval_settings.enabled and 
             self.consecutive_auto_approved_requests_count >= self.auto_approval_settings.max_requests):
@@ -285,12 +561,12 @@ class Satto:
             "role": "user",
             "content": user_content})
 
-        await self.save_satto_messages()
+        self.schedule_save(self.save_satto_messages)
 
         previous_api_req_index = -1
         response = await self.attempt_api_request(previous_api_req_index)
         if not response:
-            return False
+            return False, None
         
         # Process the response blocks and track usage
         if isinstance(response, dict) and 'text' in response:
@@ -302,13 +578,14 @@ class Satto:
                 self.total_input_tokens += input_tokens
                 self.total_output_tokens += output_tokens
             blocks = parse_assistant_message(response.text)
-            has_tool_use = any(block.type == "tool_use" for block in blocks)
+            has_tool_use = False
             next_user_content = []
+            max_auto_approved_requests = self.auto_approval_settings.max_requests
             
             # Print all text blocks and handle tool uses
             for block in blocks:                
                 if block.type == "text":
-                    if hasattr(block, 'block_type') and block.block_type == "thinking":
+                    if block.block_type == "thinking":
                         log_print.info(f"THINKING: \n{block.content}\n")
                     else:
                         log_print.info(f"TEXT: \n{block.content}\n")
@@ -317,72 +594,29 @@ class Satto:
                         "text": block.content
                     })
                 elif block.type == "tool_use":
+                    has_tool_use = True
                     tool_description = f"[{block.name}]"
                     result = None
                     
-                    # Check for auto-approval before executing any tool
-                    auto_approved = False
+                    # Check for auto-approval before executing any tool. A command that asks
+                    # for approval is never auto-approved
                     requires_approval = True  # Default to requiring approval
-                    
                     if block.name == "execute_command":
                         requires_approval = block.params.get('requires_approval', 'true').lower() == 'true'
-                        auto_approved = (not requires_approval and 
-                                      self.should_auto_approve_tool(block.name) and
-                                      self.consecutive_auto_approved_requests_count < self.auto_approval_settings.max_requests)
-                    else:
-                        auto_approved = (self.should_auto_approve_tool(block.name) and
-                                       self.consecutive_auto_approved_requests_count < self.auto_approval_settings.max_requests)
+                        
+                    auto_approved = (not (requires_approval and block.name == "execute_command") and
+                                     self.consecutive_auto_approved_requests_count < max_auto_approved_requests and
+                                     self.should_auto_approve_tool(block.name))
 
                     if auto_approved:
                         self.consecutive_auto_approved_requests_count += 1
                     elif requires_approval:
                                                 
                         # If auto-approval is enabled but this tool wasn't auto-approved, send notification
-                        if block.name == "write_to_file":
-                            self.show_notification(
-                                "Approval Required",
-                                f"Satto wants to {'edit' if os.path.exists(os.path.join(self.cwd, block.params.get('path', ''))) else 'create'} {os.path.basename(block.params.get('path', ''))}"
-                            )
-                        elif block.name == "replace_in_file":
-                            self.show_notification(
-                                "Approval Required",
-                                f"Satto wants to edit {os.path.basename(block.params.get('path', ''))}"
-                            )
-                        elif block.name == "read_file":
-                            self.show_notification(
-                                "Approval Required",
-                                f"Satto wants to read {os.path.basename(block.params.get('path', ''))}"
-                            )
-                        elif block.name == "list_files":
-                            self.show_notification(
-                                "Approval Required",
-                                f"Satto wants to view directory {os.path.basename(block.params.get('path', ''))}/"
-                            )
-                        elif block.name == "search_files":
-                            self.show_notification(
-                                "Approval Required",
-                                f"Satto wants to search files in {os.path.basename(block.params.get('path', ''))}/"
-                            )
-                        elif block.name == "execute_command":
-                            self.show_notification(
-                                "Approval Required",
-                                f"Satto wants to execute a command: {block.params.get('command', '')}"
-                            )
-                        elif block.name == "browser_action" and block.params.get('action') == "launch":
-                            self.show_notification(
-                                "Approval Required",
-                                f"Satto wants to use a browser and launch {block.params.get('url', '')}"
-                            )
-                        elif block.name == "use_mcp_tool":
-                            self.show_notification(
-                                "Approval Required",
-                                f"Satto wants to use {block.params.get('tool_name', '')} on {block.params.get('server_name', '')}"
-                            )
-                        elif block.name == "access_mcp_resource":
-                            self.show_notification(
-                                "Approval Required",
-                                f"Satto wants to access {block.params.get('uri', '')} on {block.params.get('server_name', '')}"
-                            )
+                        build_notification = APPROVAL_NOTIFICATIONS.get(block.name)
+                        notification = build_notification(block.params, self.cwd) if build_notification else None
+                        if notification:
+                            self.show_notification("Approval Required", notification)
 
                         # Ask for approval                        
                         response = await self.ask("tool_approval", f"Approve {block.name}?")
@@ -392,43 +626,29 @@ class Satto:
                                 "type": "text",
                                 "text": format_tool_denied()
                             })
-                            return False
+                            return False, None
                                                 
                     # Clean up model outputs before passing to tools
-                    if block.name == "write_to_file" and 'content' in block.params:
-                        block.params['content'] = fix_model_html_escaping(block.params['content'])
-                        block.params['content'] = remove_invalid_chars(block.params['content'])
-                        result = self.write_to_file_tool.execute(block.params)
-                    elif block.name == "replace_in_file" and 'diff' in block.params:
-                        block.params['diff'] = fix_model_html_escaping(block.params['diff'])
-                        block.params['diff'] = remove_invalid_chars(block.params['diff'])
-                        result = self.replace_in_file_tool.execute(block.params)
-                    elif block.name == "read_file":
-                        result = self.read_file_tool.execute(block.params)
-                    elif block.name == "list_files":
-                        result = await self.list_files_tool.execute(block.params)
-                    elif block.name == "search_files":
-                        result = await self.search_files_tool.execute(block.params)
-                    elif block.name == "list_code_definition_names":
-                        result = self.list_code_definition_names_tool.execute(block.params)
-                    elif block.name == "attempt_completion":
-                        result = self.attempt_completion_tool.execute(block.params)
-                    elif block.name == "execute_command":
-                        # If command was auto-approved, set a timeout to notify user if it runs too long
-                        if auto_approved:
-                            async def check_command_timeout():
-                                await asyncio.sleep(30)  # 30 second timeout
-                                self.show_notification(
-                                    "Command is still running",
-                                    "An auto-approved command has been running for 30s, and may need your attention."
-                                )
-                            asyncio.create_task(check_command_timeout())
-                            
-                        result = await self.execute_command_tool.execute(block.params)
-                    elif block.name == "ask_followup_question":
-                        result = self.ask_followup_question_tool.execute(block.params)
-                    elif block.name == "plan_mode_response":
-                        result = self.plan_mode_response_tool.execute(block.params)
+                    text_param = MODEL_TEXT_PARAMS.get(block.name)
+                    if text_param in block.params:
+                        block.params[text_param] = remove_invalid_chars(
+                            fix_model_html_escaping(block.params[text_param])
+                        )
+
+                    # If command was auto-approved, set a timeout to notify user if it runs too long
+                    if block.name == "execute_command" and auto_approved:
+                        async def check_command_timeout():
+                            await asyncio.sleep(30)  # 30 second timeout
+                            self.show_notification(
+                                "Command is still running",
+                                "An auto-approved command has been running for 30s, and may need your attention."
+                            )
+                        asyncio.create_task(check_command_timeout())
+
+                    if block.name in EXECUTABLE_TOOLS:
+                        result = getattr(self, f"{block.name}_tool").execute(block.params)
+                        if block.name in ASYNC_TOOLS:
+                            result = await result
                     
                     if result:
                         if not result.success:
@@ -437,15 +657,9 @@ class Satto:
                                 "text": format_tool_error(result.message)
                             })
                         else:
-                            if block.name in ["write_to_file", "read_file", "list_files", "search_files", 
-                                           "list_code_definition_names", "replace_in_file"]:
-                                tool_description = f"[{block.name} for '{block.params.get('path', '')}']"
-                            elif block.name == "search_files":
-                                tool_description = f"[{block.name} for '{block.params.get('regex', '')}']"
-                            elif block.name == "execute_command":
-                                tool_description = f"[{block.name} for '{block.params.get('command', '')}']"
-                            elif block.name == "ask_followup_question":
-                                tool_description = f"[{block.name} for '{block.params.get('question', '')}']"
+                            description_param = DESCRIPTION_PARAMS.get(block.name)
+                            if description_param:
+                                tool_description = f"[{block.name} for '{block.params.get(description_param, '')}']"
                             else:
                                 tool_description = f"[{block.name}]"
                             
@@ -470,11 +684,11 @@ class Satto:
                                         "text": formatted_content
                                     })
                             
-                            if block.name in ["attempt_completion", "ask_followup_question", "execute_command"]:
-                                return True
+                            if block.name in TERMINAL_TOOLS:
+                                return True, None
                         
                         if hasattr(result, 'success') and not result.success:
-                            return False
+                            return False, None
                     else:
                         error_msg = format_tool_error(f"Unknown tool: {block.name}")
                         print(f"{error_msg}\n")
@@ -487,11 +701,11 @@ class Satto:
             
             # If we had tool uses, make another request with the results
             if has_tool_use:
-                return await self.recursively_make_satto_requests(next_user_content, False, False)
+                return False, next_user_content
             
-            return has_tool_use
+            return has_tool_use, None
         
-        return False
+        return False, None
 
     async def attempt_api_request(self, previous_api_req_index: int) -> Dict[str, Any]:
         """Attempts to make an API request and handles the response.
@@ -519,12 +733,29 @@ class Satto:
         - Includes special handling for OpenRouter with one automatic retry.
         - Allows user-initiated retries if the first chunk fails.
         """
-        system_prompt = await SYSTEM_PROMPT(
+        supports_computer_use = self.api_handler.model.info.get('supports_computer_use', False)
+        # The prompt depends only on these values: the MCP mode or server names and the
+        # browser viewport, besides the working directory and computer use support
+        mcp_hub = self.mcp_hub
+        if mcp_hub is not None and not isinstance(mcp_hub, str):
+            mcp_hub = tuple(connection.server.name for connection in mcp_hub.connections)
+        viewport = getattr(self.browser_settings, 'viewport', None)
+        prompt_inputs = (
             self.cwd,
-            self.api_handler.get_model().info.get('supports_computer_use', False),
-            self.mcp_hub,
-            self.browser_settings
+            supports_computer_use,
+            mcp_hub,
+            (getattr(viewport, 'width', None), getattr(viewport, 'height', None)),
         )
+        if self._system_prompt_cache is not None and self._system_prompt_cache[0] == prompt_inputs:
+            system_prompt = self._system_prompt_cache[1]
+        else:
+            system_prompt = await SYSTEM_PROMPT(
+                self.cwd,
+                supports_computer_use,
+                self.mcp_hub,
+                self.browser_settings
+            )
+            self._system_prompt_cache = (prompt_inputs, system_prompt)
 
         if False:
             settings_custom_instructions = self.custom_instructions.strip() if self.custom_instructions else None
@@ -551,7 +782,7 @@ class Satto:
                         total_tokens = (info.get('tokensIn', 0) + info.get('tokensOut', 0) +
                                     info.get('cacheWrites', 0) + info.get('cacheReads', 0))
 
-                        context_window = self.api_handler.get_model().info.get('context_window', 128_000)
+                        context_window = self.api_handler.model.info.get('context_window', 128_000)
 
                         max_allowed_size = {
                             64_000: context_window - 27_000,  # deepseek models
@@ -585,7 +816,7 @@ class Satto:
         
         # Save LLM response
         if response and 'text' in response:            
-            save_llm_response(self.task_id, response.text)
+            await asyncio.to_thread(save_llm_response, self.task_id, response.text)
 
         return response
 
@@ -620,8 +851,11 @@ class Satto:
             bool: True if history was loaded successfully
         """
         try:
-            self.api_conversation_history = load_api_conversation_history(self.task_id)
-            self.satto_messages = load_satto_messages(self.task_id)
+            # Before anything is appended, which would start a new file without the old messages
+            await migrate_legacy_api_conversation_history_async(self.task_id)
+            self.api_conversation_history = await load_api_conversation_history_async(self.task_id)
+            self.satto_messages = await load_satto_messages_async(self.task_id)
+            self.satto_messages_dirty = False
             return len(self.api_conversation_history) > 0 or len(self.satto_messages) > 0
         except Exception as e:
             print(f"Failed to load history: {e}")
@@ -638,11 +872,11 @@ class Satto:
             Dict with response key indicating user's choice
         """
         while True:
-            response = input(f"{error_message} (y/n): ").lower().strip()
-            if response in ['y', 'yes']:
-                return {"response": "yesClicked"}
-            elif response in ['n', 'no']:
-                return {"response": "noClicked"} 
+            # Pending tasks keep running while waiting for the user
+            answer = await read_input(f"{error_message} (y/n): ")
+            response = ASK_RESPONSES.get(answer.lower().strip())
+            if response is not None:
+                return {"response": response}
             print("Please answer with 'y' or 'n'")
 
 
@@ -657,7 +891,7 @@ class Satto:
         Returns:
             float: Cost of API usage in USD based on token counts and model pricing.
         """
-        model_info = self.api_handler.get_model().info    
+        model_info = self.api_handler.model.info    
         return calculate_api_cost(
             model_info,
             self.total_input_tokens,
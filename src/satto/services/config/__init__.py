@@ -1,4 +1,5 @@
-from .config import Config
+from .config import Config, get_config
 from .auto_approval_settings import AutoApprovalSettings
 from .auth_anthropic_settings import AuthAnthropicSettings
-from .auth_openai_native_settings import AuthOpenAINativeSettings
\ No newline at end of file
+from .auth_openai_native_settings import AuthOpenAINativeSettings
+from .fields import filter_fields
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+from .fields import filter_fields
+
 
 @dataclass
 class AuthAnthropicSettings:
@@ -11,6 +13,4 @@ class AuthAnthropicSettings:
     @classmethod
     def from_dict(cls, data: dict) -> 'AuthAnthropicSettings':
         """Create an AuthAnthropicSettings instance from a dictionary."""
-        valid_keys = cls.__dataclass_fields__.keys()
-        filtered_data = {k: v for k, v in data.items() if k in valid_keys}
-        return cls(**filtered_data)
\ No newline at end of file
+        return cls(**filter_fields(cls, data))
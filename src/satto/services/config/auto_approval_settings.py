@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+from .fields import filter_fields
+
 
 @dataclass
 class AutoApprovalSettings:
@@ -23,9 +25,6 @@ class AutoApprovalSettings:
     @classmethod
     def from_dict(cls, data: dict) -> 'AutoApprovalSettings':
         """Create an AutoApprovalSettings instance from a dictionary."""
-        # Filter out any keys that aren't part of the dataclass
-        valid_keys = cls.__dataclass_fields__.keys()
-        filtered_data = {k: v for k, v in data.items() if k in valid_keys}
-        return cls(**filtered_data)
+        return cls(**filter_fields(cls, data))
     
 DEFAULT_AUTO_APPROVAL_SETTINGS = AutoApprovalSettings()
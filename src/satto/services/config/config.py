@@ -4,6 +4,7 @@ import logging
 from typing import Optional
 from pathlib import Path
 from dataclasses import asdict
+from functools import lru_cache
 
 from .auto_approval_settings import AutoApprovalSettings
 from .auth_anthropic_settings import AuthAnthropicSettings
@@ -17,6 +18,12 @@ logger = logging.getLogger(__name__)
 DEFAULT_CONFIG_PATH = "~/.config/satto/config.json"
 
 
+@lru_cache(maxsize=None)
+def _expand_config_path(path) -> Path:
+    """Return path with '~' expanded, computed once per distinct path."""
+    return Path(path).expanduser()
+
+
 class Config:
     """Represents the configuration for the Satto CLI."""
 
@@ -30,14 +37,16 @@ class Config:
             If the configuration file exists, the class is initialized with its content.
             If not, the class creates the necessary directory structure for the configuration file.
         """
-        self._path: Path = (Path(path or DEFAULT_CONFIG_PATH)).expanduser()
+        self._path: Path = _expand_config_path(path or DEFAULT_CONFIG_PATH)
         self.selected_api_provider: str = None
         self.max_consecutive_mistake_count: int = 3
         self.auto_approval: AutoApprovalSettings = AutoApprovalSettings()
         self.task_list_files: ListFilesSettings = ListFilesSettings()
         self.api_provider = DotDict({})
 
-        if self._path.exists():    
+        # Whether the config file exists, checked once and kept up to date by save()
+        self._exists: bool = self._path.exists()
+        if self._exists:
             self.load_config()
 
     def compare(self, s1: str, s2: str) -> bool:
@@ -45,33 +54,29 @@ class Config:
 
     def load_config(self):
         """Load configuration from file and update instance attributes."""
-        data = json.loads(self._path.read_text())
+        # json.loads takes the raw bytes and detects their encoding itself
+        data = json.loads(self._path.read_bytes())
         
         self.selected_api_provider = data.get('selected_api_provider')
         if not self.selected_api_provider:
             print("Error: Missing selected_api_provider in config file.")
             return
 
-        # Handle API provider settings separately
-        for key, value in data.items():            
-            if not key.startswith('api_provider_'):
-                continue            
-            if self.compare(key, self.selected_api_provider):            
-                self.api_provider = DotDict(value)
-
-        # Handle auto_approval settings separately
-        auto_approval_data = data.pop('auto_approval', {})
-        if auto_approval_data:
-            self.auto_approval = AutoApprovalSettings.from_dict(auto_approval_data)
-            
-        # Handle task_list_files settings separately
-        task_list_files_data = data.pop('task_list_files', {})
-        if task_list_files_data:
-            self.list_files = ListFilesSettings.from_dict(task_list_files_data)
-            
-        # Update remaining attributes
+        # Provider sections are matched ignoring case and surrounding whitespace, as compare() does
+        selected_provider = self.selected_api_provider.strip().lower()
+
+        # One pass over the config. The settings sections become their dataclasses, every
+        # other key becomes an attribute, and the selected provider's section the api_provider
         for key, value in data.items():
-            if not key.startswith('_'):
+            if key == 'auto_approval':
+                if value:
+                    self.auto_approval = AutoApprovalSettings.from_dict(value)
+            elif key == 'task_list_files':
+                if value:
+                    self.list_files = ListFilesSettings.from_dict(value)
+            elif not key.startswith('_'):
+                if key.startswith('api_provider_') and key.strip().lower() == selected_provider:
+                    self.api_provider = DotDict(value)
                 setattr(self, key, value)
                 
     def verify_config_dir(self):
@@ -82,7 +87,7 @@ class Config:
         Returns:
             bool: True if the directory exists or is successfully created, False otherwise.
         """
-        if self._path.exists():
+        if self._exists:
             return True
         path = self._path.parent
         try:
@@ -113,4 +118,17 @@ class Config:
 
         # Save to file
         self._path.write_text(json.dumps(data, indent=4))
+        self._exists = True
+        # Later get_config() calls load the saved file again
+        get_config.cache_clear()
         return True
+
+
+@lru_cache(maxsize=None)
+def get_config(path: Optional[Path] = None) -> Config:
+    """Return the process-wide Config for path, loading the file on first use.
+
+    Args:
+        path (Path): The path to the configuration file, the default one if not given.
+    """
+    return Config(path)
@@ -0,0 +1,18 @@
+from dataclasses import fields
+from functools import lru_cache
+from typing import Any, Dict
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> frozenset:
+    """Return the field names of a dataclass, computed once per class."""
+    return frozenset(f.name for f in fields(cls))
+
+
+def filter_fields(cls: type, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the entries of data whose keys are fields of the dataclass cls.
+
+    Used by the settings from_dict constructors, so unknown keys in the config file
+    are ignored.
+    """
+    return {k: data[k] for k in data.keys() & _field_names(cls)}
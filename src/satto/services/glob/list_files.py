@@ -1,13 +1,55 @@
 """File listing functionality with smart directory traversal and filtering."""
+import logging
 import os
+import re
 import asyncio
+import time
+from collections import deque
 from pathlib import Path
-from typing import List, Tuple, Set
-import glob
+from typing import Deque, Iterator, List, Optional, Pattern, Tuple
 import fnmatch
+from functools import lru_cache
 from ...utils.path import are_paths_equal, to_posix_path
 from ...services.config.list_files_settings import ListFilesSettings
 
+logger = logging.getLogger(__name__)
+
+# Wall-clock limit for a recursive listing, after which partial results are returned
+GLOBBING_TIMEOUT_SECONDS = 10.0
+
+@lru_cache(maxsize=8)
+def _ignore_regex(dirs_to_ignore: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    """Compile ignore patterns into one regex matching the '**/<pattern>/**' globs fnmatch would.
+
+    Returns None when there is nothing to ignore. Paths must be passed through
+    os.path.normcase before matching, as fnmatch.fnmatch does.
+    """
+    if not dirs_to_ignore:
+        return None
+    return re.compile("|".join(
+        fnmatch.translate(os.path.normcase(f"**/{ignore_pattern}/**"))
+        for ignore_pattern in dirs_to_ignore
+    ))
+
+def _scan_dir(directory: str) -> Iterator[Tuple[str, bool]]:
+    """Yield (path, is_dir) for the entries of a directory, as glob's '*' would match them.
+
+    Hidden entries are skipped and an unreadable directory yields nothing. The directory
+    check reuses the type reported by scandir, so only symlinks need an extra stat.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                yield entry.path, is_dir
+    except OSError:
+        return
+
 async def list_files(dir_path: str, recursive: bool, limit: int, settings: ListFilesSettings = None) -> Tuple[List[str], bool]:
     """List files in a directory with smart filtering and traversal.
     
@@ -20,8 +62,8 @@ async def list_files(dir_path: str, recursive: bool, limit: int, settings: ListF
     Returns:
         Tuple of (list of file paths, whether limit was hit)
     """
-    
-    print(f">>> {settings.dirs_to_ignore}")
+    if settings is not None and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("dirs_to_ignore=%r", settings.dirs_to_ignore)
     
     absolute_path = os.path.abspath(dir_path)
     
@@ -34,17 +76,20 @@ async def list_files(dir_path: str, recursive: bool, limit: int, settings: ListF
     if are_paths_equal(absolute_path, home_dir):
         return [home_dir], False
 
+    # Nothing fits, which is what a listing would report as well
+    if limit <= 0:
+        return [], True
+
     if recursive:
         files, hit_limit = await globby_level_by_level(absolute_path, limit, settings)
     else:
         # For non-recursive, just get immediate files/dirs
-        pattern = os.path.join(absolute_path, "*")
         files = []
-        for path in glob.glob(pattern):
+        for path, is_dir in _scan_dir(absolute_path):
             if len(files) >= limit:
                 return files, True
             # Add trailing slash for directories
-            if os.path.isdir(path):
+            if is_dir:
                 path = f"{path}/"
             files.append(path)
         hit_limit = len(files) >= limit
@@ -62,47 +107,45 @@ async def globby_level_by_level(dir_path: str, limit: int, settings: ListFilesSe
     Returns:
         Tuple of (list of file paths, whether limit was hit)
     """
-    results: Set[str] = set()
-    queue: List[str] = [os.path.join(dir_path, "*")]
+    # Every path is reached once, as each directory is queued once, so no set is needed
+    results: List[str] = []
+    # Directories still to list, each with a trailing slash except the root
+    queue: Deque[str] = deque([dir_path])
     
     if settings is None:
         settings = ListFilesSettings()
+    ignore_re = _ignore_regex(tuple(settings.dirs_to_ignore))
         
-    async def globbing_process() -> List[str]:
+    def globbing_process() -> List[str]:
+        # The walk makes no awaits, so its time limit is checked between directories
+        deadline = time.monotonic() + GLOBBING_TIMEOUT_SECONDS
         while queue and len(results) < limit:
-            pattern = queue.pop(0)
+            if time.monotonic() > deadline:
+                print("Globbing timed out, returning partial results")
+                break
+
+            directory = queue.popleft()
+            pattern = os.path.join(directory, "*")
             
             # Check if pattern should be ignored based on gitignore-style rules
-            should_ignore = False
-            for ignore_pattern in settings.dirs_to_ignore:
-                if fnmatch.fnmatch(pattern, f"**/{ignore_pattern}/**"):
-                    should_ignore = True
-                    break
-            if should_ignore:
+            if ignore_re is not None and ignore_re.match(os.path.normcase(pattern)):
                 continue
                 
             # Get files at this level
-            for path in glob.glob(pattern):
+            for path, is_dir in _scan_dir(directory):
                 if len(results) >= limit:
                     break
                     
                 # Add trailing slash for directories
-                if os.path.isdir(path):
+                if is_dir:
                     path = f"{path}/"
-                    # Add subdirectory pattern to queue for BFS
-                    queue.append(os.path.join(path, "*"))
+                    # Add subdirectory to queue for BFS
+                    queue.append(path)
                     
-                results.add(path)
+                results.append(path)
                 
-        return sorted(list(results)[:limit])
+        return sorted(results[:limit])
     
-    try:
-        # Run globbing process with timeout
-        globbing_task = asyncio.create_task(globbing_process())
-        files = await asyncio.wait_for(globbing_task, timeout=10.0)
-        return files, len(files) >= limit
-        
-    except asyncio.TimeoutError:
-        print("Globbing timed out, returning partial results")
-        files = sorted(list(results)[:limit])
-        return files, len(files) >= limit
+    # Walk on a worker thread, so the directory reads do not block the event loop
+    files = await asyncio.to_thread(globbing_process)
+    return files, len(files) >= limit
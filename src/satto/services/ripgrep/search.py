@@ -5,26 +5,45 @@ This module provides functionality to perform regex searches on files using ripg
 import asyncio
 import json
 import os
-import platform
+import shutil
 import sys
+from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 MAX_RESULTS = 300
 
 @dataclass
 class SearchResult:
     """Represents a single search result from ripgrep."""
+    __slots__ = ("file", "line", "column", "match", "before_context", "after_context")
+
     file: str
     line: int
     column: int
     match: str
-    before_context: List[str]
-    after_context: List[str]
+    # ripgrep runs with --context 1, so there is at most one context line per side
+    before_context: Optional[str]
+    after_context: Optional[str]
+
+@lru_cache(maxsize=None)
+def get_ripgrep_path() -> str:
+    """Locate the ripgrep binary, caching the result so later searches skip the lookup."""
+    rg_path = shutil.which("rg")
+    if not rg_path:
+        raise RuntimeError(
+            "Ripgrep (rg) not found. Please install ripgrep:\n"
+            "- macOS: brew install ripgrep\n"
+            "- Ubuntu/Debian: apt install ripgrep\n"
+            "- Windows: choco install ripgrep or scoop install ripgrep\n"
+            "For more installation options, visit: https://github.com/BurntSushi/ripgrep#installation"
+        )
+    return rg_path
 
-async def exec_ripgrep(bin_path: str, args: List[str]) -> str:
-    """Execute ripgrep command and return its output."""
+async def exec_ripgrep(bin_path: str, args: List[str]) -> bytes:
+    """Execute ripgrep command and return its raw (undecoded) output."""
     process = await asyncio.create_subprocess_exec(
         bin_path,
         *args,
@@ -32,57 +51,49 @@ async def exec_ripgrep(bin_path: str, args: List[str]) -> str:
         stderr=asyncio.subprocess.PIPE
     )
 
+    # Drain stderr concurrently so ripgrep never blocks on a full stderr pipe
+    # while we are still reading stdout
+    stderr_task = asyncio.create_task(process.stderr.read())
+
     output = []
     line_count = 0
     max_lines = MAX_RESULTS * 5  # Limit output similar to TypeScript version
 
-    while True:
-        line = await process.stdout.readline()
-        if not line:
-            break
-        
-        if line_count < max_lines:
-            output.append(line.decode().rstrip())
-            line_count += 1
-        else:
+    async for line in process.stdout:
+        if line_count >= max_lines:
+            # Stop ripgrep rather than just stop reading, otherwise it would block on a full stdout pipe
             process.terminate()
             break
+        output.append(line.rstrip())
+        line_count += 1
 
-    error = await process.stderr.read()
+    error = await stderr_task
     await process.wait()
 
     if error:
         error_msg = error.decode()
         raise RuntimeError(f"ripgrep process error: {error_msg}")
 
-    return "\n".join(output)
+    return b"\n".join(output)
 
-def format_results(results: List[SearchResult], cwd: str) -> str:
-    """Format search results into a readable string."""
-    grouped_results = {}
-    
+def format_results(grouped_results: Dict[str, List[SearchResult]], result_count: int) -> str:
+    """Format search results, already grouped by relative file path, into a readable string."""
     output = []
-    if len(results) >= MAX_RESULTS:
+    if result_count >= MAX_RESULTS:
         output.append(f"Showing first {MAX_RESULTS} of {MAX_RESULTS}+ results. Use a more specific search if necessary.\n")
     else:
-        result_count = len(results)
         output.append(f"Found {result_count} result{'s' if result_count != 1 else ''}.\n")
 
-    # Group results by file
-    for result in results[:MAX_RESULTS]:
-        rel_path = os.path.relpath(result.file, cwd).replace("\\", "/")
-        if rel_path not in grouped_results:
-            grouped_results[rel_path] = []
-        grouped_results[rel_path].append(result)
-
     # Format each file's results
     for file_path, file_results in grouped_results.items():
         output.append(f"{file_path}\n│----")
 
         for idx, result in enumerate(file_results):
-            all_lines = result.before_context + [result.match] + result.after_context
-            for line in all_lines:
-                output.append(f"│{line.rstrip()}")
+            if result.before_context is not None:
+                output.append(f"│{result.before_context.rstrip()}")
+            output.append(f"│{result.match.rstrip()}")
+            if result.after_context is not None:
+                output.append(f"│{result.after_context.rstrip()}")
 
             if idx < len(file_results) - 1:
                 output.append("│----")
@@ -104,25 +115,9 @@ async def regex_search_files(cwd: str, directory_path: str, regex: str, file_pat
     Returns:
         Formatted string containing search results with context
     """
-    # Find ripgrep in system PATH
+    # Find ripgrep in system PATH (looked up once per process)
     try:
-        process = await asyncio.create_subprocess_exec(
-            "where" if platform.system() == "Windows" else "which",
-            "rg",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, _ = await process.communicate()
-        if process.returncode == 0:
-            rg_path = stdout.decode().splitlines()[0] if platform.system() == "Windows" else stdout.decode().strip()
-        else:
-            raise RuntimeError(
-                "Ripgrep (rg) not found. Please install ripgrep:\n"
-                "- macOS: brew install ripgrep\n"
-                "- Ubuntu/Debian: apt install ripgrep\n"
-                "- Windows: choco install ripgrep or scoop install ripgrep\n"
-                "For more installation options, visit: https://github.com/BurntSushi/ripgrep#installation"
-            )
+        rg_path = get_ripgrep_path()
     except Exception as e:
         raise RuntimeError(
             f"Error finding ripgrep: {str(e)}\n"
@@ -139,41 +134,61 @@ async def regex_search_files(cwd: str, directory_path: str, regex: str, file_pat
     if not output:
         return "No results found"
 
-    results: List[SearchResult] = []
+    # Results are grouped by relative file path as they are parsed
+    grouped_results: Dict[str, List[SearchResult]] = defaultdict(list)
+    result_count = 0
     current_result = None
+    pending_context = None  # (line_number, text) of a context line that may precede the next match
+    last_file = None
+    rel_path = None
+    json_loads = json.loads
 
-    for line in output.split("\n"):
+    # json.loads accepts bytes, so each line is UTF-8 decoded exactly once
+    for line in output.split(b"\n"):
         if not line:
             continue
 
         try:
-            parsed = json.loads(line)
-            if parsed["type"] == "match":
-                if current_result:
-                    results.append(current_result)
-                
+            parsed = json_loads(line)
+            record_type = parsed["type"]
+            if record_type == "match":
+                result_count += 1
+                if result_count > MAX_RESULTS:
+                    break
+
+                data = parsed["data"]
+                line_number = data["line_number"]
+                before_context = None
+                if pending_context and pending_context[0] == line_number - 1:
+                    before_context = pending_context[1]
+                pending_context = None
+
                 current_result = SearchResult(
-                    file=parsed["data"]["path"]["text"],
-                    line=parsed["data"]["line_number"],
-                    column=parsed["data"]["submatches"][0]["start"],
-                    match=parsed["data"]["lines"]["text"],
-                    before_context=[],
-                    after_context=[]
+                    file=data["path"]["text"],
+                    line=line_number,
+                    column=data["submatches"][0]["start"],
+                    match=data["lines"]["text"],
+                    before_context=before_context,
+                    after_context=None
                 )
-            elif parsed["type"] == "context" and current_result:
-                context_line = parsed["data"]["lines"]["text"]
-                if parsed["data"]["line_number"] < current_result.line:
-                    current_result.before_context.append(context_line)
+                if current_result.file != last_file:
+                    last_file = current_result.file
+                    rel_path = os.path.relpath(last_file, cwd).replace("\\", "/")
+                grouped_results[rel_path].append(current_result)
+            elif record_type == "context":
+                data = parsed["data"]
+                line_number = data["line_number"]
+                if (current_result and current_result.after_context is None
+                        and current_result.file == data["path"]["text"]
+                        and line_number == current_result.line + 1):
+                    current_result.after_context = data["lines"]["text"]
                 else:
-                    current_result.after_context.append(context_line)
+                    pending_context = (line_number, data["lines"]["text"])
         except json.JSONDecodeError:
-            print(f"Error parsing ripgrep output line: {line}", file=sys.stderr)
+            print(f"Error parsing ripgrep output line: {line.decode(errors='replace')}", file=sys.stderr)
             continue
         except KeyError as e:
             print(f"Missing key in ripgrep output: {e}", file=sys.stderr)
             continue
 
-    if current_result:
-        results.append(current_result)
-
-    return format_results(results, cwd)
+    return format_results(grouped_results, result_count)
@@ -31,16 +31,22 @@ class DotDict(dict, metaclass=DotDictMeta):
 
     def __getattr__(self, k):
         """Get property."""
-        value = self.get(k)
-        if isinstance(value, dict):
-            return DotDict(value)
-        return value
+        return self.get(k)
 
     def get(self, k, default=None):
-        """Get value, returns default if key doesn't exist."""
-        value = super().get(k, default)
-        if isinstance(value, dict):
-            return DotDict(value)
+        """Get value, returns default if key doesn't exist.
+
+        A nested plain dict is wrapped in a DotDict on first access and the wrapper is
+        stored in its place, so later accesses return it without copying again.
+        """
+        value = dict.get(self, k, _RaiseKeyError)
+        if value is _RaiseKeyError:
+            if isinstance(default, dict) and not isinstance(default, DotDict):
+                return DotDict(default)
+            return default
+        if isinstance(value, dict) and not isinstance(value, DotDict):
+            value = DotDict(value)
+            dict.__setitem__(self, k, value)
         return value
 
     def update(self, *args, **kwargs):
@@ -1,14 +1,23 @@
 """Utility functions for Satto."""
 
 from .string import fix_model_html_escaping, remove_invalid_chars
-from .path import to_posix_path, are_paths_equal, get_readable_path
+from .path import to_posix_path, are_paths_equal, get_readable_path, is_within
 from .history import (
     ensure_history_dir_exists,
     ensure_task_dir_exists,
     save_api_conversation_history,
+    append_api_conversation_message,
     load_api_conversation_history,
+    load_first_api_conversation_message,
     save_satto_messages,
     load_satto_messages,
+    save_api_conversation_history_async,
+    append_api_conversation_message_async,
+    load_api_conversation_history_async,
+    migrate_legacy_api_conversation_history,
+    migrate_legacy_api_conversation_history_async,
+    save_satto_messages_async,
+    load_satto_messages_async,
     get_task_history,    
     get_latest_task,
     get_latest_task_id
@@ -22,12 +31,22 @@ __all__ = [
     'to_posix_path',
     'are_paths_equal',
     'get_readable_path',
+    'is_within',
     'ensure_history_dir_exists',
     'ensure_task_dir_exists',
     'save_api_conversation_history',
+    'append_api_conversation_message',
     'load_api_conversation_history', 
+    'load_first_api_conversation_message',
     'save_satto_messages',
     'load_satto_messages',
+    'save_api_conversation_history_async',
+    'append_api_conversation_message_async',
+    'load_api_conversation_history_async',
+    'migrate_legacy_api_conversation_history',
+    'migrate_legacy_api_conversation_history_async',
+    'save_satto_messages_async',
+    'load_satto_messages_async',
     'get_task_history',
     'get_latest_task'
 ]
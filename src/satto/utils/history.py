@@ -1,7 +1,13 @@
 import os
 import json
+import asyncio
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
+
+_HISTORY_DIR = os.path.expanduser("~/.config/satto/history")
 
 
 def ensure_history_dir_exists() -> str:
@@ -10,9 +16,19 @@ def ensure_history_dir_exists() -> str:
     Returns:
         str: Path to the history directory
     """
-    history_dir = os.path.expanduser("~/.config/satto/history")
-    os.makedirs(history_dir, exist_ok=True)
-    return history_dir
+    os.makedirs(_HISTORY_DIR, exist_ok=True)
+    return _HISTORY_DIR
+
+# Only the path strings are cached. The directories are still created on every call
+# (makedirs with exist_ok is cheap), so a task directory removed while the process runs
+# is recreated by the next save instead of making it fail
+@lru_cache(maxsize=None)
+def _task_dir_path(task_id: str) -> str:
+    return os.path.join(_HISTORY_DIR, task_id)
+
+@lru_cache(maxsize=None)
+def _task_file_name(task_id: str, filename: str) -> str:
+    return os.path.join(_task_dir_path(task_id), filename)
 
 def ensure_task_dir_exists(task_id: str) -> str:
     """Ensure the task directory exists and return its path.
@@ -23,37 +39,135 @@ def ensure_task_dir_exists(task_id: str) -> str:
     Returns:
         str: Path to the task directory
     """
-    task_dir = os.path.join(ensure_history_dir_exists(), task_id)
+    task_dir = _task_dir_path(task_id)
     os.makedirs(task_dir, exist_ok=True)
     return task_dir
 
+def _task_file_path(task_id: str, filename: str) -> str:
+    """Return the path of a file in the task directory, creating the directory if needed.
+    
+    Args:
+        task_id: The unique identifier for the task
+        filename: Name of the file inside the task directory
+        
+    Returns:
+        str: Path to the file
+    """
+    ensure_task_dir_exists(task_id)
+    return _task_file_name(task_id, filename)
+
+# The API conversation history is stored as JSON lines, one message per line, so a new
+# message is appended instead of rewriting the whole file. Older tasks used a single JSON file
+API_HISTORY_FILE = "api_conversation_history.jsonl"
+LEGACY_API_HISTORY_FILE = "api_conversation_history.json"
+UI_MESSAGES_FILE = "ui_messages.json"
+
 def save_api_conversation_history(task_id: str, history: List[Dict]) -> None:
-    """Save the API conversation history to disk.
+    """Save the API conversation history to disk, replacing what was saved before.
     
     Args:
         task_id: The unique identifier for the task
         history: List of conversation messages
     """
-    task_dir = ensure_task_dir_exists(task_id)
-    history_file = os.path.join(task_dir, "api_conversation_history.json")
-    with open(history_file, "w", encoding="utf-8") as f:
-        json.dump(history, f, indent=2)
+    history_file = _task_file_path(task_id, API_HISTORY_FILE)
+    # Written to a temporary file and renamed over the history, so a concurrent reader
+    # never sees a partly written file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(history_file), prefix=".history-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(message, separators=(",", ":")) + "\n" for message in history)
+        os.replace(tmp_path, history_file)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def append_api_conversation_message(task_id: str, message: Dict) -> None:
+    """Append a single message to the API conversation history on disk.
+    
+    Args:
+        task_id: The unique identifier for the task
+        message: The conversation message to append
+    """
+    history_file = _task_file_path(task_id, API_HISTORY_FILE)
+    with open(history_file, "a", encoding="utf-8") as f:
+        f.write(json.dumps(message, separators=(",", ":")) + "\n")
+
+def _load_legacy_api_conversation_history(task_id: str) -> Optional[List[Dict]]:
+    """Load a history saved in the older single-JSON format, or None if there is none."""
+    legacy_file = _task_file_path(task_id, LEGACY_API_HISTORY_FILE)
+    try:
+        with open(legacy_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
 
 def load_api_conversation_history(task_id: str) -> List[Dict]:
     """Load the API conversation history from disk.
     
+    A history in the older single-JSON format is read as is; it is only converted by
+    migrate_legacy_api_conversation_history.
+    
     Args:
         task_id: The unique identifier for the task
         
     Returns:
         List[Dict]: List of conversation messages
     """
-    task_dir = ensure_task_dir_exists(task_id)
-    history_file = os.path.join(task_dir, "api_conversation_history.json")
-    if os.path.exists(history_file):
+    history_file = _task_file_path(task_id, API_HISTORY_FILE)
+    try:
         with open(history_file, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return []
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        pass
+
+    return _load_legacy_api_conversation_history(task_id) or []
+
+def migrate_legacy_api_conversation_history(task_id: str) -> None:
+    """Convert a history in the older single-JSON format to JSON lines.
+    
+    Must run before messages are appended to such a task, since appending would start
+    a new JSON lines file without the old messages.
+    
+    Args:
+        task_id: The unique identifier for the task
+    """
+    if os.path.exists(_task_file_path(task_id, API_HISTORY_FILE)):
+        return
+    history = _load_legacy_api_conversation_history(task_id)
+    if history is None:
+        return
+    save_api_conversation_history(task_id, history)
+    try:
+        os.remove(_task_file_path(task_id, LEGACY_API_HISTORY_FILE))
+    except FileNotFoundError:
+        pass  # Migrated concurrently by another process
+
+def load_first_api_conversation_message(task_id: str) -> Optional[Dict]:
+    """Load only the first message of the API conversation history.
+    
+    With the JSON lines format this reads a single line instead of the whole history.
+    
+    Args:
+        task_id: The unique identifier for the task
+        
+    Returns:
+        Optional[Dict]: The first conversation message, or None if the history is empty
+    """
+    history_file = _task_file_path(task_id, API_HISTORY_FILE)
+    try:
+        with open(history_file, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    return json.loads(line)
+        return None
+    except FileNotFoundError:
+        pass
+
+    history = _load_legacy_api_conversation_history(task_id)
+    return history[0] if history else None
 
 def save_satto_messages(task_id: str, messages: List[Dict]) -> None:
     """Save the Satto UI messages to disk.
@@ -62,10 +176,10 @@ def save_satto_messages(task_id: str, messages: List[Dict]) -> None:
         task_id: The unique identifier for the task
         messages: List of UI messages
     """
-    task_dir = ensure_task_dir_exists(task_id)
-    messages_file = os.path.join(task_dir, "ui_messages.json")
+    messages_file = _task_file_path(task_id, UI_MESSAGES_FILE)
     with open(messages_file, "w", encoding="utf-8") as f:
-        json.dump(messages, f, indent=2)
+        # json.dumps without indent runs the C encoder, json.dump always encodes in Python
+        f.write(json.dumps(messages, separators=(",", ":")))
 
 def load_satto_messages(task_id: str) -> List[Dict]:
     """Load the Satto UI messages from disk.
@@ -76,12 +190,88 @@ def load_satto_messages(task_id: str) -> List[Dict]:
     Returns:
         List[Dict]: List of UI messages
     """
-    task_dir = ensure_task_dir_exists(task_id)
-    messages_file = os.path.join(task_dir, "ui_messages.json")
-    if os.path.exists(messages_file):
+    messages_file = _task_file_path(task_id, UI_MESSAGES_FILE)
+    try:
         with open(messages_file, "r", encoding="utf-8") as f:
             return json.load(f)
-    return []
+    except FileNotFoundError:
+        return []
+
+def _dir_size(path: str) -> int:
+    """Return the total size of the files under path, like summing sizes over os.walk.
+
+    Directory entries come from scandir, so telling files from directories needs no
+    extra stat. Symlinked directories are not followed and unreadable directories
+    are skipped, as os.walk does.
+    """
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        return 0
+
+    total = 0
+    with entries:
+        for entry in entries:
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    total += _dir_size(entry.path)
+            else:
+                total += entry.stat().st_size
+    return total
+
+# Upper bound on the threads used to load task metadata. The work is small file reads,
+# which release the GIL, so tasks are loaded concurrently
+MAX_TASK_LOAD_WORKERS = 32
+
+def _task_order(task_id: str) -> Tuple[int, int]:
+    """Return the sort key of a task ID: its start time in seconds, then its counter.
+
+    Task IDs are "<seconds>-<pid>-<counter>", so tasks started within the same second
+    keep their order. Older IDs are just "<seconds>" and get counter 0.
+
+    Raises:
+        ValueError: If the ID does not start with a timestamp
+    """
+    parts = task_id.split("-")
+    counter = int(parts[2]) if len(parts) > 2 and parts[2].isdigit() else 0
+    return int(parts[0]), counter
+
+def _load_task_metadata(task_entry: os.DirEntry) -> Optional[Dict]:
+    """Load the metadata of a single task directory.
+    
+    Args:
+        task_entry: Directory entry of the task inside the history directory
+        
+    Returns:
+        Optional[Dict]: The task metadata, or None if the task has no usable history
+    """
+    task_id = task_entry.name
+    try:
+        # Get task metadata from first message
+        first_message = load_first_api_conversation_message(task_id)
+        if not first_message or not first_message.get("content"):
+            return None
+            
+        # Extract task from content
+        task_content = first_message["content"][0]["text"] if isinstance(first_message["content"], list) else ""
+        
+        # Calculate task size
+        task_size = _dir_size(task_entry.path)
+        
+        return {
+            "id": task_id,
+            "ts": _task_order(task_id)[0],  # Task ID starts with its timestamp
+            "task": task_content,
+            "size": task_size
+        }
+    except Exception as e:
+        print(f"Error loading task {task_id}: {e}")
+        return None
+
+def _list_task_dirs() -> List[os.DirEntry]:
+    """Return the directory entries of all task directories in the history directory."""
+    with os.scandir(ensure_history_dir_exists()) as entries:
+        return [entry for entry in entries if entry.is_dir()]
 
 def get_task_history() -> List[Dict]:
     """Get a list of all tasks and their metadata.
@@ -89,45 +279,16 @@ def get_task_history() -> List[Dict]:
     Returns:
         List[Dict]: List of task metadata sorted by timestamp in descending order
     """
-    history_dir = ensure_history_dir_exists()
-    tasks = []
-    
-    for task_id in os.listdir(history_dir):
-        task_dir = os.path.join(history_dir, task_id)
-        if not os.path.isdir(task_dir):
-            continue
-            
-        try:
-            # Try to load API conversation history
-            history = load_api_conversation_history(task_id)
-            if not history:
-                continue
-                
-            # Get task metadata from first message
-            first_message = history[0]
-            if not first_message or not first_message.get("content"):
-                continue
-                
-            # Extract task from content
-            task_content = first_message["content"][0]["text"] if isinstance(first_message["content"], list) else ""
-            
-            # Calculate task size
-            task_size = 0
-            for root, _, files in os.walk(task_dir):
-                for file in files:
-                    task_size += os.path.getsize(os.path.join(root, file))
-            
-            tasks.append({
-                "id": task_id,
-                "ts": int(task_id),  # Task ID is timestamp
-                "task": task_content,
-                "size": task_size
-            })
-        except Exception as e:
-            print(f"Error loading task {task_id}: {e}")
-            continue
+    task_dirs = _list_task_dirs()
+
+    if len(task_dirs) > 1:
+        with ThreadPoolExecutor(max_workers=min(MAX_TASK_LOAD_WORKERS, len(task_dirs))) as executor:
+            results = list(executor.map(_load_task_metadata, task_dirs))
+    else:
+        results = [_load_task_metadata(entry) for entry in task_dirs]
             
-    return sorted(tasks, key=lambda x: x["ts"], reverse=True)
+    tasks = [task for task in results if task is not None]
+    return sorted(tasks, key=lambda x: _task_order(x["id"]), reverse=True)
 
 def get_latest_task() -> Optional[Dict]:
     """Get the most recent task's metadata.
@@ -135,8 +296,21 @@ def get_latest_task() -> Optional[Dict]:
     Returns:
         Optional[Dict]: The latest task's metadata or None if no tasks exist
     """
-    tasks = get_task_history()
-    return tasks[0] if tasks else None
+    # Task IDs start with their timestamp, so tasks are tried newest first and only
+    # loaded until one has usable metadata, instead of loading the whole history
+    ordered_dirs = []
+    for entry in _list_task_dirs():
+        try:
+            ordered_dirs.append((_task_order(entry.name), entry))
+        except ValueError:
+            continue
+    ordered_dirs.sort(key=lambda x: x[0], reverse=True)
+
+    for _, entry in ordered_dirs:
+        task = _load_task_metadata(entry)
+        if task is not None:
+            return task
+    return None
 
 def get_latest_task_id() -> Optional[str]:
     """Get the ID of the most recent task.
@@ -147,43 +321,28 @@ def get_latest_task_id() -> Optional[str]:
     latest_task = get_latest_task()
     return latest_task["id"] if latest_task else None
 
-def get_next_llm_response_number(task_id: str) -> int:
-    """Get the next available LLM response number for a task.
-    
-    Args:
-        task_id: The unique identifier for the task
-        
-    Returns:
-        int: The next available response number
-    """
-    task_dir = ensure_task_dir_exists(task_id)
-    existing_responses = [f for f in os.listdir(task_dir) if f.startswith("LLM_response_")]
-    if not existing_responses:
-        return 1
-    
-    numbers = [int(f.split("_")[-1]) for f in existing_responses]
-    return max(numbers) + 1
+# LLM responses are appended to a single JSON lines file, one response per line, so saving
+# a response is one append instead of a directory listing plus a new file. Older tasks
+# stored each response in its own LLM_response_<n> file
+LLM_RESPONSES_FILE = "LLM_responses.jsonl"
+LEGACY_LLM_RESPONSE_PREFIX = "LLM_response_"
 
 def save_llm_response(task_id: str, response: Union[str, Dict]) -> None:
-    """Save an LLM response to disk with an incremental number.
+    """Append an LLM response to the task's responses file.
     
     Args:
         task_id: The unique identifier for the task
         response: The LLM response to save (string or dict)
     """
-    task_dir = ensure_task_dir_exists(task_id)
-    response_number = get_next_llm_response_number(task_id)
-    response_file = os.path.join(task_dir, f"LLM_response_{response_number}")
-    
-    with open(response_file, "w", encoding="utf-8") as f:
-        if isinstance(response, dict):
-            json.dump(response, f, indent=2)
-        else:
-            f.write(response)
+    responses_file = _task_file_path(task_id, LLM_RESPONSES_FILE)
+    with open(responses_file, "a", encoding="utf-8") as f:
+        f.write(json.dumps(response) + "\n")
 
 def load_llm_responses(task_id: str) -> List[Union[str, Dict]]:
     """Load all LLM responses for a task from disk.
     
+    Responses saved in the older one-file-per-response format come first.
+    
     Args:
         task_id: The unique identifier for the task
         
@@ -194,17 +353,81 @@ def load_llm_responses(task_id: str) -> List[Union[str, Dict]]:
     responses = []
     
     for file in sorted(os.listdir(task_dir)):
-        if not file.startswith("LLM_response_"):
+        if not file.startswith(LEGACY_LLM_RESPONSE_PREFIX):
             continue
             
         file_path = os.path.join(task_dir, file)
         with open(file_path, "r", encoding="utf-8") as f:
-            try:
-                response = json.load(f)
-            except json.JSONDecodeError:
-                # If not JSON, read as plain text
-                f.seek(0)
-                response = f.read()
-            responses.append(response)
+            data = f.read()
+        try:
+            response = json.loads(data)
+        except json.JSONDecodeError:
+            # If not JSON, keep the plain text
+            response = data
+        responses.append(response)
+
+    responses_file = _task_file_path(task_id, LLM_RESPONSES_FILE)
+    try:
+        with open(responses_file, "r", encoding="utf-8") as f:
+            responses.extend(json.loads(line) for line in f if line.strip())
+    except FileNotFoundError:
+        pass
             
     return responses
+
+async def save_api_conversation_history_async(task_id: str, history: List[Dict]) -> None:
+    """Save the API conversation history to disk without blocking the event loop.
+    
+    Args:
+        task_id: The unique identifier for the task
+        history: List of conversation messages
+    """
+    await asyncio.to_thread(save_api_conversation_history, task_id, history)
+
+async def append_api_conversation_message_async(task_id: str, message: Dict) -> None:
+    """Append a message to the API conversation history without blocking the event loop.
+    
+    Args:
+        task_id: The unique identifier for the task
+        message: The conversation message to append
+    """
+    await asyncio.to_thread(append_api_conversation_message, task_id, message)
+
+async def load_api_conversation_history_async(task_id: str) -> List[Dict]:
+    """Load the API conversation history from disk without blocking the event loop.
+    
+    Args:
+        task_id: The unique identifier for the task
+        
+    Returns:
+        List[Dict]: List of conversation messages
+    """
+    return await asyncio.to_thread(load_api_conversation_history, task_id)
+
+async def migrate_legacy_api_conversation_history_async(task_id: str) -> None:
+    """Convert a legacy API conversation history to JSON lines without blocking the event loop.
+    
+    Args:
+        task_id: The unique identifier for the task
+    """
+    await asyncio.to_thread(migrate_legacy_api_conversation_history, task_id)
+
+async def save_satto_messages_async(task_id: str, messages: List[Dict]) -> None:
+    """Save the Satto UI messages to disk without blocking the event loop.
+    
+    Args:
+        task_id: The unique identifier for the task
+        messages: List of UI messages
+    """
+    await asyncio.to_thread(save_satto_messages, task_id, messages)
+
+async def load_satto_messages_async(task_id: str) -> List[Dict]:
+    """Load the Satto UI messages from disk without blocking the event loop.
+    
+    Args:
+        task_id: The unique identifier for the task
+        
+    Returns:
+        List[Dict]: List of UI messages
+    """
+    return await asyncio.to_thread(load_satto_messages, task_id)
@@ -1,5 +1,29 @@
+import sys
+import time
 from colorama import Fore
-from datetime import datetime
+
+# The escape sequences are constant, so each colored message is built with a single
+# f-string instead of two concatenations
+_RED = Fore.RED
+_YELLOW = Fore.YELLOW
+_GREEN = Fore.GREEN
+_BLUE = Fore.BLUE
+_RESET = Fore.RESET
+
+# Timestamp of the last info line, in tenths of a second, and its formatted form. Lines
+# logged within the same tenth of a second reuse the string
+_last_time_key = None
+_last_time_str = ""
+
+def _current_time() -> str:
+    """Return the local time as HH:MM:SS.d, formatting it at most once per tenth of a second."""
+    global _last_time_key, _last_time_str
+    key = int(time.time() * 10)
+    if key != _last_time_key:
+        tm = time.localtime(key // 10)
+        _last_time_str = f"{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}.{key % 10}"
+        _last_time_key = key
+    return _last_time_str
 
 class LogPrint:
     """
@@ -11,27 +35,28 @@ class LogPrint:
         
     @staticmethod
     def red(msg):
-        return Fore.RED + msg + Fore.RESET
+        return f"{_RED}{msg}{_RESET}"
 
     @staticmethod
     def yellow(msg):
-        return Fore.YELLOW + msg + Fore.RESET
+        return f"{_YELLOW}{msg}{_RESET}"
 
     @staticmethod
     def green(msg):
-        return Fore.GREEN + msg + Fore.RESET
+        return f"{_GREEN}{msg}{_RESET}"
 
     @staticmethod
     def blue(msg):
-        return Fore.BLUE + msg + Fore.RESET    
+        return f"{_BLUE}{msg}{_RESET}"
 
     @staticmethod
     def info(msg, with_time=True):
+        # One write including the newline, so a line-buffered stdout flushes once per message
+        # rather than once for the message and again for print's line ending
         if with_time:
-            current_time = datetime.now().strftime('%H:%M:%S.%f')[:-5]            
-            print(f"[{current_time}] {msg}")
+            sys.stdout.write(f"[{_current_time()}] {msg}\n")
         else:
-            print(msg)
+            sys.stdout.write(f"{msg}\n")
 
     def warning(self, msg):
         msg = self.yellow(msg) if self.use_colors else msg
@@ -1,8 +1,11 @@
 """Path utility functions for consistent path handling across platforms."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
+_DESKTOP_DIR = os.path.join(os.path.expanduser("~"), "Desktop")
+
 
 def to_posix_path(path_str: str) -> str:
     """
@@ -14,10 +17,12 @@ def to_posix_path(path_str: str) -> str:
     Returns:
         Path string using forward slashes
     """
+    if os.sep == "/":
+        return path_str  # Already POSIX, nothing to convert
     # Extended-Length Paths in Windows start with "\\?\\"
     if path_str.startswith("\\\\?\\"):
         return path_str  # Preserve extended-length paths in Windows
-    return path.replace(os.sep, "/")
+    return path_str.replace(os.sep, "/")
 
 def are_paths_equal(path1: str, path2: str) -> bool:
     """Check if two paths are equal, accounting for case sensitivity and normalization."""
@@ -27,6 +32,12 @@ def are_paths_equal(path1: str, path2: str) -> bool:
     return os.path.normcase(os.path.normpath(path1)) == os.path.normcase(os.path.normpath(path2))
 
 
+def _are_abs_paths_equal(abs_path1: str, abs_path2: str) -> bool:
+    """Check if two already absolute (and therefore normalized) paths are equal."""
+    return abs_path1 == abs_path2 or os.path.normcase(abs_path1) == os.path.normcase(abs_path2)
+
+
+@lru_cache(maxsize=2048)
 def get_readable_path(cwd: str, rel_path: str = "") -> str:
     """
     Get a user-friendly path string relative to the current working directory.
@@ -38,19 +49,42 @@ def get_readable_path(cwd: str, rel_path: str = "") -> str:
     Returns:
         User-friendly path string
     """
-    # Resolve the absolute path
-    abs_path = os.path.abspath(os.path.join(cwd, rel_path))
-    
+    # Resolve the absolute paths once
+    cwd_abs = os.path.abspath(cwd)
+    abs_path = os.path.abspath(os.path.join(cwd_abs, rel_path))
+
     # If cwd is Desktop, show full path
-    if are_paths_equal(cwd, os.path.join(os.path.expanduser("~"), "Desktop")):
+    if _are_abs_paths_equal(cwd_abs, _DESKTOP_DIR):
         return to_posix_path(abs_path)
-    
+
     # If path is the cwd, just show the base name
-    if are_paths_equal(abs_path, cwd):
+    if _are_abs_paths_equal(abs_path, cwd_abs):
         return to_posix_path(os.path.basename(abs_path))
-    
+
     # Show relative path if within cwd, otherwise show absolute path
-    rel_to_cwd = os.path.relpath(abs_path, cwd)
-    if abs_path.startswith(cwd):
-        return to_posix_path(rel_to_cwd)
+    if abs_path.startswith(cwd_abs.rstrip(os.sep) + os.sep):
+        return to_posix_path(os.path.relpath(abs_path, cwd_abs))
     return to_posix_path(abs_path)
+
+
+def is_within(root: Path, root_prefix: str, path: Path) -> bool:
+    """
+    Check whether a resolved path is the root directory or lies inside it.
+
+    Args:
+        root: The resolved root directory
+        root_prefix: os.path.join(str(root), ''), computed once by the caller so the
+            common case is a string prefix test
+        path: The resolved path to check
+
+    Returns:
+        True if path is root or inside it
+    """
+    if str(path).startswith(root_prefix) or path == root:
+        return True
+    # The prefix test is case-sensitive, so let relative_to have the final say
+    try:
+        path.relative_to(root)
+    except ValueError:
+        return False
+    return True
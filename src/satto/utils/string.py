@@ -1,5 +1,15 @@
 """String utility functions for processing text from AI model outputs."""
 
+# Entities replaced by fix_model_html_escaping. "&amp;" comes after the others so that
+# "&amp;lt;" becomes "&lt;" rather than "<"
+HTML_ENTITY_REPLACEMENTS = (
+    ("&gt;", ">"),
+    ("&lt;", "<"),
+    ("&quot;", '"'),
+    ("&amp;", "&"),
+    ("&apos;", "'"),
+)
+
 def fix_model_html_escaping(text: str) -> str:
     """
     Fixes incorrectly escaped HTML entities in AI model outputs.
@@ -10,14 +20,10 @@ def fix_model_html_escaping(text: str) -> str:
     Returns:
         String with HTML entities converted back to normal characters
     """
-    replacements = {
-        "&gt;": ">",
-        "&lt;": "<",
-        "&quot;": '"',
-        "&amp;": "&",
-        "&apos;": "'"
-    }
-    for entity, char in replacements.items():
+    # Every entity starts with "&", so most text needs just this one scan
+    if "&" not in text:
+        return text
+    for entity, char in HTML_ENTITY_REPLACEMENTS:
         text = text.replace(entity, char)
     return text
 
@@ -1,46 +1,67 @@
-import os
 import sys
 import argparse
 import asyncio
 import textwrap
-from importlib.metadata import version
 
-from satto import Satto
-from satto.utils.log_print import LogPrint
 
+class VersionAction(argparse.Action):
+    """Print the installed satto version and exit.
 
-log_print = LogPrint()
+    importlib.metadata is only imported when --version is given, so it adds nothing to
+    the start-up of a regular run.
+    """
 
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help="show program's version number and exit"):
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
 
-async def async_main():
+    def __call__(self, parser, namespace, values, option_string=None):
+        from importlib.metadata import version
+        parser.exit(message=f'satto {version("satto")}\n')
+
+
+def parse_args(argv=None):
     parser = argparse.ArgumentParser(description="Anthropic CLI: Interact with Claude AI")
-    parser.add_argument('--version', action='version', version=f'satto {version("satto")}')
+    parser.add_argument('--version', action=VersionAction)
     subparsers = parser.add_subparsers(dest='command', required=True)
-    
+
     # Start command
     start_parser = subparsers.add_parser('start', help='Start a new task')
     start_parser.add_argument("prompt", type=str, help="Enter a prompt to send to Claude")
-    
+
     # Continue command
     resume_parser = subparsers.add_parser('cont', help='Continue an existing task')
     resume_parser.add_argument("prompt", type=str, help="Enter a prompt to send to Claude")
-    
-    args = parser.parse_args()    
+
+    return parser.parse_args(argv)
+
+
+async def async_main(args):
+    # The satto package is imported only once the arguments are valid, so --help,
+    # --version and usage errors return without loading it
+    from satto import Satto
+    from satto.utils.log_print import LogPrint
+    from satto.api.providers.http_client import close_shared_http_client
+
+    log_print = LogPrint()
     client = Satto()
-    
+
     log_print.header(f"{client.api_provider.name} {args.command} task: {args.prompt}")
-    
-    if args.command == 'start':
-        await client.start_task(args.prompt)
-    else:  # resume
-        await client.resume_task(args.prompt)
+
+    try:
+        if args.command == 'start':
+            await client.start_task(args.prompt)
+        else:  # resume
+            await client.resume_task(args.prompt)
+    finally:
+        await close_shared_http_client()
     log_print.info(textwrap.dedent(f"""Claude's Done. 
 cost: {client.get_cost()}.
 task_id: {client.get_task_id()}."""))
 
 
 def main():
-    return asyncio.run(async_main())
+    args = parse_args()
+    return asyncio.run(async_main(args))
 
 
 if __name__ == "__main__":
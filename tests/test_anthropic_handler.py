@@ -0,0 +1,57 @@
+import asyncio
+from types import SimpleNamespace as NS
+
+from satto.api.providers.anthropic import AnthropicHandler
+
+
+class FakeStream:
+    def __init__(self, events):
+        self._events = iter(events)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._events)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class FakeMessages:
+    def __init__(self, events):
+        self.events = events
+
+    async def create(self, **kwargs):
+        return FakeStream(self.events)
+
+
+def make_handler(events):
+    handler = AnthropicHandler({"api_key": "test-key"})
+    handler.client = NS(messages=FakeMessages(events))
+    return handler
+
+
+def test_create_message_reports_final_usage(capsys):
+    events = [
+        NS(type="message_start", message=NS(usage=NS(
+            input_tokens=120, output_tokens=1,
+            cache_creation_input_tokens=30, cache_read_input_tokens=40,
+        ))),
+        NS(type="content_block_start", index=0, content_block=NS(text="")),
+        NS(type="content_block_delta", index=0, delta=NS(text="Hello")),
+        NS(type="content_block_delta", index=0, delta=NS(text=" world")),
+        NS(type="content_block_stop", index=0),
+        NS(type="message_delta", usage=NS(output_tokens=57)),
+        NS(type="message_stop"),
+    ]
+
+    response = asyncio.run(make_handler(events).create_message("system", [{"role": "user", "content": "hi"}]))
+
+    assert response.text == "Hello world"
+    assert response.usage == {
+        "input_tokens": 120,
+        "output_tokens": 57,
+        "cache_write_tokens": 30,
+        "cache_read_tokens": 40,
+    }
@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from satto.api.providers.api_handler_base import ApiHandlerBase
+
+
+class Handler(ApiHandlerBase):
+    pass
+
+
+class FakeStream:
+    def __init__(self, count, error=None):
+        self.count = count
+        self.error = error
+        self.sent = 0
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await asyncio.sleep(0)
+        if self.sent == self.count:
+            if self.error is not None:
+                raise self.error
+            raise StopAsyncIteration
+        self.sent += 1
+        return self.sent
+
+    async def close(self):
+        self.closed = True
+
+
+async def consume(stream, stop_at=None):
+    received = []
+    async with Handler().buffered_stream(stream) as chunks:
+        async for chunk in chunks:
+            received.append(chunk)
+            if chunk == stop_at:
+                break
+    return received
+
+
+def test_buffered_stream_yields_every_chunk_and_closes_the_stream():
+    stream = FakeStream(100)
+    assert asyncio.run(consume(stream)) == list(range(1, 101))
+    assert stream.closed
+
+
+def test_buffered_stream_closes_the_stream_on_early_exit():
+    stream = FakeStream(1000)
+    assert asyncio.run(consume(stream, stop_at=3)) == [1, 2, 3]
+    assert stream.closed
+
+
+def test_buffered_stream_reraises_stream_errors():
+    stream = FakeStream(2, error=ValueError("boom"))
+    with pytest.raises(ValueError, match="boom"):
+        asyncio.run(consume(stream))
+    assert stream.closed
@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from satto.utils import history
+
+
+@pytest.fixture(autouse=True)
+def history_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(history, "_HISTORY_DIR", str(tmp_path))
+    # Cached task paths are built on _HISTORY_DIR
+    history._task_dir_path.cache_clear()
+    history._task_file_name.cache_clear()
+    yield tmp_path
+    history._task_dir_path.cache_clear()
+    history._task_file_name.cache_clear()
+
+
+def test_appended_messages_are_reloaded_in_order():
+    history.save_api_conversation_history("task", [{"role": "user", "content": "hi"}])
+    history.append_api_conversation_message("task", {"role": "assistant", "content": "hello"})
+    history.append_api_conversation_message("task", {"role": "user", "content": "bye"})
+
+    assert history.load_api_conversation_history("task") == [
+        {"role": "user", "content": "hi"},
+        {"role": "assistant", "content": "hello"},
+        {"role": "user", "content": "bye"},
+    ]
+    assert history.load_first_api_conversation_message("task") == {"role": "user", "content": "hi"}
+
+
+def test_legacy_json_history_is_migrated_to_json_lines(history_dir):
+    messages = [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "hello"}]
+    task_dir = history_dir / "task"
+    task_dir.mkdir()
+    legacy = task_dir / history.LEGACY_API_HISTORY_FILE
+    legacy.write_text(json.dumps(messages), encoding="utf-8")
+
+    # Loading reads the legacy file without converting it
+    assert history.load_api_conversation_history("task") == messages
+    assert legacy.exists()
+
+    history.migrate_legacy_api_conversation_history("task")
+    history.append_api_conversation_message("task", {"role": "user", "content": "bye"})
+
+    assert not legacy.exists()
+    assert (task_dir / history.API_HISTORY_FILE).exists()
+    assert history.load_api_conversation_history("task") == messages + [{"role": "user", "content": "bye"}]
+
+
+def test_save_recreates_a_removed_task_directory(history_dir):
+    history.save_satto_messages("task", [{"text": "one"}])
+    (history_dir / "task" / history.UI_MESSAGES_FILE).unlink()
+    (history_dir / "task").rmdir()
+
+    history.save_satto_messages("task", [{"text": "two"}])
+
+    assert history.load_satto_messages("task") == [{"text": "two"}]
@@ -0,0 +1,47 @@
+from satto.core.assistant_message.parse_assistant_message import (
+    TextContent,
+    ToolUse,
+    parse_assistant_message,
+)
+
+
+def text(content, block_type=None):
+    return TextContent(type="text", content=content, block_type=block_type)
+
+
+def test_stray_closing_tag_is_text():
+    assert parse_assistant_message("Done </read_file> here") == [text("Done </read_file> here")]
+
+
+def test_unclosed_tool_block_is_text():
+    message = "Reading it now\n<read_file>\n<path>a.txt</path>"
+
+    assert parse_assistant_message(message) == [
+        text("Reading it now"),
+        text("<read_file>\n<path>a.txt</path>"),
+    ]
+
+
+def test_text_around_thinking_is_kept():
+    blocks = parse_assistant_message("Before <thinking>\nplan it\n</thinking> after")
+
+    assert blocks == [text("plan it", "thinking"), text("Before  after")]
+
+
+def test_tool_tag_inside_content_belongs_to_the_content():
+    message = (
+        "<write_to_file>\n"
+        "<path>notes.md</path>\n"
+        "<content>\nUse <read_file><path>x.txt</path></read_file> to read it\n</content>\n"
+        "</write_to_file>\n"
+        "Written."
+    )
+
+    assert parse_assistant_message(message) == [
+        ToolUse(
+            type="tool_use",
+            name="write_to_file",
+            params={"path": "notes.md", "content": "Use <read_file><path>x.txt</path></read_file> to read it"},
+        ),
+        text("Written."),
+    ]
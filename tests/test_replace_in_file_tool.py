@@ -0,0 +1,79 @@
+import os
+
+import pytest
+
+from satto.core.assistant_message.replace_in_file_tool import ReplaceInFileTool
+
+DIFF = "<<<<<<< SEARCH\nold line\n=======\nnew line\n>>>>>>> REPLACE\n"
+
+
+def read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks not supported")
+def test_edit_through_symlink_updates_link_target(tmp_path):
+    real = tmp_path / "real.txt"
+    real.write_text("old line\n", encoding="utf-8")
+    link = tmp_path / "link.txt"
+    link.symlink_to(real)
+
+    result = ReplaceInFileTool(str(tmp_path)).execute({"path": "link.txt", "diff": DIFF})
+
+    assert result.success
+    assert link.is_symlink()
+    assert read(real) == "new line\n"
+    assert read(link) == "new line\n"
+
+
+def test_edit_of_hard_linked_file_updates_every_link(tmp_path):
+    real = tmp_path / "real.txt"
+    real.write_text("old line\n", encoding="utf-8")
+    hard = tmp_path / "hard.txt"
+    os.link(real, hard)
+
+    result = ReplaceInFileTool(str(tmp_path)).execute({"path": "real.txt", "diff": DIFF})
+
+    assert result.success
+    assert os.path.samefile(real, hard)
+    assert read(real) == "new line\n"
+    assert read(hard) == "new line\n"
+
+
+def test_edit_keeps_file_mode(tmp_path):
+    script = tmp_path / "script.sh"
+    script.write_text("old line\n", encoding="utf-8")
+    script.chmod(0o751)
+
+    result = ReplaceInFileTool(str(tmp_path)).execute({"path": "script.sh", "diff": DIFF})
+
+    assert result.success
+    assert read(script) == "new line\n"
+    assert script.stat().st_mode & 0o777 == 0o751
+    assert [p.name for p in tmp_path.iterdir()] == ["script.sh"]
+
+
+def test_search_matches_lines_with_different_indentation(tmp_path):
+    path = tmp_path / "f.py"
+    path.write_text("def f():\n    a = 1\n    return a\n", encoding="utf-8")
+    diff = "<<<<<<< SEARCH\ndef f():\n  a = 1\n=======\ndef f():\n    a = 2\n>>>>>>> REPLACE\n"
+
+    result = ReplaceInFileTool(str(tmp_path)).execute({"path": "f.py", "diff": diff})
+
+    assert result.success
+    assert read(path) == "def f():\n    a = 2\n    return a\n"
+
+
+def test_anchor_match_starts_after_the_previous_block(tmp_path):
+    path = tmp_path / "f.txt"
+    path.write_text("start\n  one\nend\nstart\n  two\nend\n", encoding="utf-8")
+    diff = (
+        "<<<<<<< SEARCH\nstart\n  one\nend\n=======\nFIRST\n>>>>>>> REPLACE\n"
+        "<<<<<<< SEARCH\nstart\n  outdated\nend\n=======\nSECOND\n>>>>>>> REPLACE\n"
+    )
+
+    result = ReplaceInFileTool(str(tmp_path)).execute({"path": "f.txt", "diff": diff})
+
+    assert result.success
+    assert read(path) == "FIRST\nSECOND\n"